@@ -0,0 +1,49 @@
+"""unique store sku
+
+Revision ID: 5c2e8a91d4f3
+Revises: 19718223ee0e
+Create Date: 2026-10-16 09:12:41.318204
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = '5c2e8a91d4f3'
+down_revision: Union[str, None] = '19718223ee0e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Earlier schemas allowed several listings per (store_id, store_sku).  Keep
+    # the oldest one, move the duplicates' price history onto it, and drop
+    # the duplicates so the constraint can be created.
+    op.execute(
+        """
+        UPDATE price_records AS pr
+        SET store_product_id = dup.keep_id
+        FROM (
+            SELECT id, MIN(id) OVER (PARTITION BY store_id, store_sku) AS keep_id
+            FROM store_products
+            WHERE store_sku IS NOT NULL
+        ) AS dup
+        WHERE pr.store_product_id = dup.id AND dup.id <> dup.keep_id
+        """
+    )
+    op.execute(
+        """
+        DELETE FROM store_products AS sp
+        USING store_products AS keep
+        WHERE sp.store_id = keep.store_id
+          AND sp.store_sku = keep.store_sku
+          AND sp.id > keep.id
+        """
+    )
+    op.create_unique_constraint(
+        'uq_store_products_store_sku', 'store_products', ['store_id', 'store_sku']
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('uq_store_products_store_sku', 'store_products', type_='unique')
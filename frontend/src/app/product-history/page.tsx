@@ -66,8 +66,8 @@ export default function ProductHistoryPage() {
 
   // Similar products
   const { data: similarResults } = useQuery({
-    queryKey: queryKeys.searchPrices(debouncedSearch, 100),
-    queryFn: () => searchPrices(debouncedSearch, 100),
+    queryKey: queryKeys.searchPrices(debouncedSearch, 100, "effective"),
+    queryFn: () => searchPrices(debouncedSearch, 100, "effective"),
     staleTime: staleTimes.searchPrices,
     enabled: debouncedSearch.length >= 2,
   });
@@ -83,13 +83,8 @@ export default function ProductHistoryPage() {
       }));
   }, [comparison]);
 
-  const sortedSimilar = useMemo(
-    () =>
-      [...(similarResults ?? [])].sort(
-        (a, b) => a.effective_price - b.effective_price
-      ),
-    [similarResults]
-  );
+  // Already ordered by effective price on the API side
+  const sortedSimilar = similarResults ?? [];
 
   return (
     <div>
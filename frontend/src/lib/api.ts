@@ -64,9 +64,13 @@ export function fetchPriceHistory(productId: number, days = 30) {
   );
 }
 
-export function searchPrices(q: string, limit = 60) {
+export function searchPrices(
+  q: string,
+  limit = 60,
+  sort: "name" | "effective" = "name"
+) {
   return fetchApi<SearchPriceResult[]>(
-    `/api/search-prices?q=${encodeURIComponent(q)}&limit=${limit}`
+    `/api/search-prices?q=${encodeURIComponent(q)}&limit=${limit}&sort=${sort}`
   );
 }
 
@@ -9,8 +9,8 @@ export const queryKeys = {
     limit?: number;
     search?: string;
   }) => ["products", params] as const,
-  searchPrices: (q: string, limit?: number) =>
-    ["search-prices", q, limit] as const,
+  searchPrices: (q: string, limit?: number, sort?: string) =>
+    ["search-prices", q, limit, sort] as const,
   priceHistory: (productId: number, days?: number) =>
     ["price-history", productId, days] as const,
   comparison: (productId: number) => ["comparison", productId] as const,
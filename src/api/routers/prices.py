@@ -74,12 +74,18 @@ async def price_history(
 async def search_prices(
     q: str = Query(..., min_length=2, description="Search term"),
     limit: int = Query(30, ge=1, le=100),
+    sort: str = Query(
+        "name",
+        pattern="^(name|effective)$",
+        description="Order by product name or by effective (promo-aware) price",
+    ),
     session: AsyncSession = Depends(get_session),
 ):
     """Search products by name and return their latest prices grouped by store.
 
     This is useful for cross-store comparison: search 'milk' to see milk prices
-    across Tesco, Aldi, Dunnes, etc.
+    across Tesco, Aldi, Dunnes, etc.  With ``sort=effective`` the cheapest
+    matches are returned first, ordered in SQL before the limit is applied.
     """
     # Latest price per store_product (window function)
     latest_price_subq = (
@@ -110,6 +116,12 @@ async def search_prices(
         .subquery()
     )
 
+    effective_price = func.coalesce(latest.c.promo_price, latest.c.price)
+    if sort == "effective":
+        order_by = (effective_price, StoreProduct.store_name)
+    else:
+        order_by = (StoreProduct.store_name, Store.name)
+
     # Join store_products -> stores -> latest prices, filter by name
     stmt = (
         select(
@@ -127,7 +139,7 @@ async def search_prices(
         .join(Product, Product.id == StoreProduct.product_id)
         .join(latest, latest.c.store_product_id == StoreProduct.id)
         .where(StoreProduct.store_name.ilike(f"%{q}%"))
-        .order_by(StoreProduct.store_name, Store.name)
+        .order_by(*order_by)
         .limit(limit)
     )
 
@@ -10,6 +10,7 @@ from sqlalchemy import (
     Numeric,
     String,
     Text,
+    UniqueConstraint,
     func,
 )
 from sqlalchemy.orm import Mapped, mapped_column, relationship
@@ -59,6 +60,9 @@ class Product(Base):
 
 class StoreProduct(Base):
     __tablename__ = "store_products"
+    __table_args__ = (
+        UniqueConstraint("store_id", "store_sku", name="uq_store_products_store_sku"),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)
     product_id: Mapped[int] = mapped_column(ForeignKey("products.id"), nullable=False)
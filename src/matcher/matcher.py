@@ -8,11 +8,12 @@ from __future__ import annotations
 
 import logging
 from dataclasses import dataclass
+from decimal import Decimal
 
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
 from sqlalchemy import func, select
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import contains_eager
 
 from src.core.models import Product, StoreProduct
 from src.matcher.normalizer import extract_brand, extract_unit_info, normalize_name
@@ -49,39 +50,51 @@ def fuzzy_match(
     """Return the best fuzzy match above *threshold* using token-sort ratio.
 
     Uses ``rapidfuzz.fuzz.token_sort_ratio`` which is robust to word-order
-    differences (e.g. "Avonmore Milk 2L" vs "Milk Avonmore 2L").
+    differences (e.g. "Avonmore Milk 2L" vs "Milk Avonmore 2L").  Scoring is
+    delegated to ``rapidfuzz.process.extractOne`` with ``score_cutoff`` so
+    candidates that cannot reach *threshold* (e.g. wildly different lengths)
+    are rejected early inside rapidfuzz instead of being fully scored.
     """
     normalised = normalize_name(name)
     if not normalised:
         return None
 
-    best_score: float = 0.0
-    best_match: Product | None = None
-
-    for candidate in candidates:
+    choices: dict[int, str] = {}
+    for idx, candidate in enumerate(candidates):
         candidate_norm = normalize_name(candidate.name)
-        if not candidate_norm:
-            continue
+        if candidate_norm:
+            choices[idx] = candidate_norm
 
-        score = fuzz.token_sort_ratio(normalised, candidate_norm)
-        if score > best_score:
-            best_score = score
-            best_match = candidate
+    if not choices:
+        return None
 
-    if best_score >= threshold and best_match is not None:
-        return best_match
-    return None
+    best = process.extractOne(
+        normalised,
+        choices,
+        scorer=fuzz.token_sort_ratio,
+        score_cutoff=threshold,
+    )
+    if best is None:
+        return None
+
+    _, _, idx = best
+    return candidates[idx]
 
 
 def find_match(
     raw_product: RawProduct,
     existing_products: list[Product],
+    unit_info: dict[int, tuple[str | None, Decimal | None]] | None = None,
 ) -> Product | None:
     """Try to match a raw scraped product against existing canonical products.
 
     Strategy:
     1. EAN exact match (fastest, most reliable).
     2. Fuzzy name match with unit-info cross-check.
+
+    *unit_info* optionally maps product id to a precomputed
+    ``extract_unit_info`` result so callers matching many products against
+    the same candidates do not re-scan candidate names.
     """
     # Build a temporary Product-like object for ean_match
     if raw_product.ean:
@@ -96,7 +109,10 @@ def find_match(
 
     # Cross-check unit info when available to reduce false positives
     raw_unit, raw_size = extract_unit_info(raw_product.name)
-    match_unit, match_size = extract_unit_info(match.name)
+    if unit_info is not None and match.id in unit_info:
+        match_unit, match_size = unit_info[match.id]
+    else:
+        match_unit, match_size = extract_unit_info(match.name)
 
     if raw_unit and match_unit:
         if raw_unit != match_unit or raw_size != match_size:
@@ -129,10 +145,13 @@ async def run_matching(session: AsyncSession) -> int:
         .subquery()
     )
 
+    # Join the Product in the same query rather than issuing a second
+    # SELECT via selectinload.
     singleton_sps_result = await session.execute(
         select(StoreProduct)
-        .where(StoreProduct.product_id.in_(select(singleton_subq.c.id)))
-        .options(selectinload(StoreProduct.product))
+        .join(StoreProduct.product)
+        .where(Product.id.in_(select(singleton_subq.c.id)))
+        .options(contains_eager(StoreProduct.product))
     )
     singleton_sps: list[StoreProduct] = list(singleton_sps_result.scalars().all())
 
@@ -171,6 +190,9 @@ async def run_matching(session: AsyncSession) -> int:
             seen_ids.add(p.id)
             unique_candidates.append(p)
 
+    # Unit info only depends on the candidate name, so extract it once
+    unit_info = {c.id: extract_unit_info(c.name) for c in unique_candidates}
+
     merges = 0
 
     for sp in singleton_sps:
@@ -184,7 +206,7 @@ async def run_matching(session: AsyncSession) -> int:
 
         # Remove the product itself from candidates to avoid self-match
         filtered = [c for c in unique_candidates if c.id != product.id]
-        match = find_match(raw, filtered)
+        match = find_match(raw, filtered, unit_info)
 
         if match is None:
             continue
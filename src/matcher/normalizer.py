@@ -134,10 +134,16 @@ KNOWN_BRANDS = [
     "Yoplait",
 ]
 
-# Pre-compile brand patterns for performance
-_BRAND_PATTERNS = [
-    (brand, re.compile(rf"\b{re.escape(brand)}\b", re.IGNORECASE)) for brand in KNOWN_BRANDS
-]
+# Pre-compile all brands into a single alternation so extract_brand runs one
+# regex search instead of one per brand.  Longer brands come first so that at
+# a given position the most specific brand wins.
+_BRAND_RE = re.compile(
+    r"\b("
+    + "|".join(re.escape(brand) for brand in sorted(KNOWN_BRANDS, key=len, reverse=True))
+    + r")\b",
+    re.IGNORECASE,
+)
+_BRAND_CANONICAL = {brand.lower(): brand for brand in KNOWN_BRANDS}
 
 
 def normalize_name(name: str) -> str:
@@ -180,14 +186,14 @@ def normalize_name(name: str) -> str:
 def extract_brand(name: str) -> str | None:
     """Try to extract a brand name from a product name.
 
-    Returns the first known brand found, or None.
+    Returns the left-most known brand found, or None.
     """
     if not name:
         return None
 
-    for brand, pattern in _BRAND_PATTERNS:
-        if pattern.search(name):
-            return brand
+    match = _BRAND_RE.search(name)
+    if match:
+        return _BRAND_CANONICAL[match.group(1).lower()]
 
     # Heuristic: the first capitalised word might be a brand if it is not
     # a generic grocery term.
@@ -18,30 +18,26 @@ from src.core.config import settings
 from src.core.database import async_session
 from src.core.models import ScrapeRun, Store
 from src.matcher.matcher import run_matching
+from src.scrapers import SCRAPERS
+from src.scrapers.base import start_shared_browser, stop_shared_browser
 
 logger = logging.getLogger(__name__)
 
 
 async def _run_scraper(store_slug: str) -> None:
-    """Dynamically import and execute a scraper for the given store slug.
+    """Run the scraper registered in ``SCRAPERS`` for the given store slug.
 
-    Each scraper module is expected to live at ``src.scrapers.<slug>`` and
-    expose an async ``run()`` coroutine.
+    Each run gets a fresh scraper instance; its browser work borrows the
+    Chromium started by :func:`start_shared_browser`.
     """
-    module_name = f"src.scrapers.{store_slug}"
+    scraper_cls = SCRAPERS.get(store_slug)
+    if scraper_cls is None:
+        logger.warning("No scraper registered for %s -- skipping", store_slug)
+        return
     try:
-        import importlib
-
-        mod = importlib.import_module(module_name)
-        run_fn = getattr(mod, "run", None)
-        if run_fn is None:
-            logger.warning("Scraper module %s has no run() function -- skipping", module_name)
-            return
         logger.info("Starting scraper for %s", store_slug)
-        await run_fn()
-        logger.info("Scraper for %s completed successfully", store_slug)
-    except ModuleNotFoundError:
-        logger.warning("No scraper module found at %s -- skipping", module_name)
+        result = await scraper_cls().run()
+        logger.info("Scraper for %s finished: %s", store_slug, result.status)
     except Exception:
         logger.exception("Scraper for %s failed", store_slug)
 
@@ -97,6 +93,9 @@ async def _main() -> None:
         format="%(asctime)s | %(levelname)-8s | %(name)s | %(message)s",
     )
 
+    # Launch Chromium now rather than inside the first scrape
+    await start_shared_browser()
+
     scheduler = create_scheduler()
     scheduler.start()
     logger.info("Scheduler started. Press Ctrl+C to exit.")
@@ -108,7 +107,19 @@ async def _main() -> None:
     except (KeyboardInterrupt, SystemExit):
         logger.info("Shutting down scheduler")
         scheduler.shutdown()
+    finally:
+        await stop_shared_browser()
+
+
+def _loop_factory():
+    """Return uvloop's event loop factory if installed, else ``None`` (stock loop)."""
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return uvloop.new_event_loop
 
 
 if __name__ == "__main__":
-    asyncio.run(_main())
+    with asyncio.Runner(loop_factory=_loop_factory()) as runner:
+        runner.run(_main())
@@ -9,13 +9,21 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import os
 import re
 import sys
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ProcessPoolExecutor
 from decimal import Decimal, InvalidOperation
+from functools import lru_cache
+from urllib.parse import urljoin, urlsplit
 
 import httpx
-from bs4 import BeautifulSoup
-from playwright.async_api import Page, Response
+import orjson
+from lxml import etree
+from lxml import html as lxml_html
+from playwright.async_api import BrowserContext, Page, Response, Route
+from playwright.async_api import TimeoutError as PlaywrightTimeoutError
 
 from src.scrapers.base import (
     BaseScraper,
@@ -23,6 +31,7 @@ from src.scrapers.base import (
     DEFAULT_HEADERS,
     random_delay,
     random_user_agent,
+    stable_hash,
 )
 
 logger = logging.getLogger(__name__)
@@ -49,12 +58,123 @@ CATEGORY_PATHS = [
 # Special offers page (rendered with JS, needs Playwright)
 SPECIAL_OFFERS_URL = f"{BASE_URL}/specials"
 
+# Regexes used per tile
+_RE_SKU_P = re.compile(r"/p/(\d+)")
+_RE_SKU_SLUG = re.compile(r"/(\w+-\d+)")
+_RE_SIZE = re.compile(r"(\d+(?:\.\d+)?)\s*(ml|l|g|kg|cl|pk|pack)\b", re.IGNORECASE)
+
+
+class _PriceChars(dict):
+    """``str.translate`` table that keeps digits, ``.`` and ``,`` only.
+
+    Entries are filled in on first sight of each character, so the table
+    stays small while still covering any currency symbol or unit text.
+    """
+
+    def __missing__(self, codepoint: int) -> int | None:
+        char = chr(codepoint)
+        keep = codepoint if char.isdecimal() or char in ".," else None
+        self[codepoint] = keep
+        return keep
+
+
+_PRICE_CHARS = _PriceChars()
+
+# CSS selector for product tiles, used by the Playwright fallback
+_TILE_SELECTOR = (
+    "div.product-tile, "
+    "div[class*='ProductTile'], "
+    "article[class*='product'], "
+    "div[data-qa='product-tile'], "
+    "a[class*='ProductTile']"
+)
+
+
+def _has_class(name: str) -> str:
+    """XPath predicate matching a whole class token, like CSS ``.name``."""
+    return f"contains(concat(' ', normalize-space(@class), ' '), ' {name} ')"
+
+
+# XPath equivalents of the tile selectors, compiled once and evaluated
+# directly on the lxml tree
+_XPATH_TILES = etree.XPath(
+    f"//div[{_has_class('product-tile')}]"
+    " | //div[contains(@class, 'ProductTile')]"
+    " | //article[contains(@class, 'product')]"
+    " | //div[@data-qa='product-tile']"
+    " | //a[contains(@class, 'ProductTile')]"
+)
+_XPATH_TILES_FALLBACK = etree.XPath(
+    "//div[contains(@class, 'mod-article-tile')]"
+    f" | //div[{_has_class('box--product')}]"
+    " | //div[contains(@class, 'product-card')]"
+)
+_XPATH_NAME = etree.XPath(
+    ".//a[contains(@class, 'Title')]"
+    " | .//h4//a"
+    " | .//h3//a"
+    " | .//p[contains(@class, 'title')]"
+)
+_XPATH_LINK = etree.XPath(".//a")
+_XPATH_PRICE = etree.XPath(
+    ".//span[contains(@class, 'price')]"
+    " | .//span[contains(@class, 'Price')]"
+    " | .//div[contains(@class, 'price')]"
+    " | .//p[contains(@class, 'price')]"
+)
+_XPATH_IMG = etree.XPath(".//img")
+# Promo badges (span.*offer*, span.*badge*, span.*promo*, div.*badge*) and
+# brand labels (span.*brand*, span.*Brand*) in one pass; told apart by class
+_XPATH_BADGES = etree.XPath(
+    ".//span[contains(@class, 'offer') or contains(@class, 'badge')"
+    " or contains(@class, 'promo') or contains(@class, 'brand')"
+    " or contains(@class, 'Brand')]"
+    " | .//div[contains(@class, 'badge')]"
+)
+_RE_PROMO_CLASS = re.compile(r"offer|badge|promo")
+_RE_BRAND_CLASS = re.compile(r"brand|Brand")
+
+# Next-page link, read by _parse_page from the same tree as the tiles.
+# Equivalent to "a[rel='next'], a.pagination__next, li.next a,
+# a[aria-label='Next page']".
+_XPATH_NEXT_HREF = etree.XPath(
+    "//a[@rel='next']/@href"
+    f" | //a[{_has_class('pagination__next')}]/@href"
+    f" | //li[{_has_class('next')}]//a/@href"
+    " | //a[@aria-label='Next page']/@href"
+)
+
+# Playwright locators for the JS-rendered specials page
+_SPECIAL_TILES = (
+    "div[class*='SpecialBuy'], "
+    "div[class*='product-tile'], "
+    "div[data-qa='special-buy-tile'], "
+    "article[class*='product']"
+)
+_SPECIAL_NAME = "h4, h3, a[class*='Title'], p[class*='title']"
+_SPECIAL_PRICE = "span[class*='price'], span[class*='Price']"
+
+# Cookie / consent buttons, dismissed with a single compound locator
+_OVERLAY_BUTTONS = (
+    "button:has-text('Accept All'), "
+    "button:has-text('Accept Cookies'), "
+    "button:has-text('Accept'), "
+    "button[id*='onetrust-accept'], "
+    "button[class*='cookie-accept']"
+)
+
 
 class AldiScraper(BaseScraper):
     store_slug = "aldi"
+    # Plain category pages are cheap to fetch; stay well under the rate limit
+    max_concurrency = 6
+    delay_enabled = False
 
     def __init__(self) -> None:
         self._client: httpx.AsyncClient | None = None
+        self._parse_pool: ProcessPoolExecutor | None = None
+        # SKUs returned by categories that have finished this run
+        self._seen_skus: set[str] = set()
 
     # ------------------------------------------------------------------
     # Category URLs
@@ -75,201 +195,155 @@ class AldiScraper(BaseScraper):
 
         # Standard category pages — try httpx first
         try:
-            return await self._scrape_with_httpx(category_url)
+            products = await self._scrape_with_httpx(category_url)
         except Exception as exc:
             logger.warning(
                 "[aldi] httpx scrape failed for %s (%s), falling back to Playwright",
                 category_url,
                 exc,
             )
-            return await self._scrape_with_playwright(category_url)
+            products = await self._scrape_with_playwright(category_url)
+
+        # Only a finished category claims its SKUs; a failed attempt must not
+        # hide products from its fallback or from other categories
+        self._seen_skus.update(product.store_sku for product in products)
+        return products
 
     # ------------------------------------------------------------------
     # httpx-based scraping (preferred for standard pages)
     # ------------------------------------------------------------------
     async def _scrape_with_httpx(self, category_url: str) -> list[RawProduct]:
-        """Fetch the category page with httpx and parse with BeautifulSoup."""
+        """Fetch the category pages with httpx and parse them with lxml.
+
+        Each page is parsed once, in the process pool, which also returns
+        the next-page link.  Pages of one category are therefore fetched one
+        after another: the next URL is only known once the previous page has
+        parsed.  Overlap comes from ``max_concurrency`` categories fetching
+        and parsing side by side.
+        """
         products: list[RawProduct] = []
+        category_skus: set[str] = set()
+        loop = asyncio.get_running_loop()
+        current_url: str | None = category_url
+        page_num = 0
+
+        while current_url:
+            page_num += 1
+            logger.info("[aldi] Fetching %s", current_url)
+            response = await self._fetch(current_url)
+            batch, next_url = await loop.run_in_executor(
+                self._get_parse_pool(), _parse_page, response.content, current_url
+            )
+            before = len(products)
+            products.extend(self._unseen(batch, category_skus))
+            logger.info(
+                "[aldi] Page %d: parsed %d products (total %d)",
+                page_num,
+                len(products) - before,
+                len(products),
+            )
 
-        headers = {**DEFAULT_HEADERS, "User-Agent": random_user_agent()}
-
-        async with httpx.AsyncClient(
-            headers=headers,
-            follow_redirects=True,
-            timeout=30.0,
-        ) as client:
-            page_num = 1
-            current_url = category_url
-
-            while current_url:
-                logger.info("[aldi] Fetching %s", current_url)
-                response = await client.get(current_url)
-                response.raise_for_status()
-
-                soup = BeautifulSoup(response.text, "html.parser")
-                batch = self._parse_html(soup, category_url)
-                products.extend(batch)
-
-                logger.info(
-                    "[aldi] Page %d: parsed %d products (total %d)",
-                    page_num,
-                    len(batch),
-                    len(products),
-                )
-
-                # Check for next page
-                next_link = soup.select_one(
-                    "a[rel='next'], "
-                    "a.pagination__next, "
-                    "li.next a, "
-                    "a[aria-label='Next page']"
-                )
-                if next_link and next_link.get("href"):
-                    next_href = next_link["href"]
-                    if not next_href.startswith("http"):
-                        next_href = f"{BASE_URL}{next_href}"
-                    current_url = next_href
-                    page_num += 1
-                    await random_delay(1.0, 2.5)
-                else:
-                    current_url = None
+            current_url = next_url
+            if current_url:
+                await random_delay(1.0, 2.5)
 
         return products
 
-    def _parse_html(self, soup: BeautifulSoup, category_url: str) -> list[RawProduct]:
-        """Parse product data from a BeautifulSoup-parsed Aldi category page."""
-        products: list[RawProduct] = []
-
-        # Aldi uses product tiles / boxes
-        tiles = soup.select(
-            "div.product-tile, "
-            "div[class*='ProductTile'], "
-            "article[class*='product'], "
-            "div[data-qa='product-tile'], "
-            "a[class*='ProductTile']"
-        )
-
-        if not tiles:
-            # Fallback: try broader selectors
-            tiles = soup.select(
-                "div[class*='mod-article-tile'], "
-                "div.box--product, "
-                "div[class*='product-card']"
+    async def _fetch(self, url: str) -> httpx.Response:
+        """GET *url*, backing off while aldi.ie answers 429 Too Many Requests."""
+        client = self._get_client()
+        for attempt in range(3):
+            response = await client.get(url, headers={"User-Agent": random_user_agent()})
+            if response.status_code != 429 or attempt == 2:
+                break
+            retry_after = response.headers.get("Retry-After", "")
+            delay = float(retry_after) if retry_after.isdigit() else 5.0 * 2**attempt
+            logger.warning("[aldi] Rate limited on %s, retrying in %.0fs", url, delay)
+            await asyncio.sleep(delay)
+        response.raise_for_status()
+        return response
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared httpx client, creating it on first use.
+
+        One client is kept for the whole run so every category and page
+        reuses the same keep-alive (HTTP/2) connections to aldi.ie.
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                headers=DEFAULT_HEADERS,
+                http2=True,
+                follow_redirects=True,
+                timeout=30.0,
+                limits=httpx.Limits(
+                    max_connections=20,
+                    max_keepalive_connections=20,
+                    keepalive_expiry=30.0,
+                ),
             )
-
-        for tile in tiles:
-            try:
-                # --- Name + link ---
-                name_el = (
-                    tile.select_one("a[class*='Title'], h4 a, h3 a, p[class*='title']")
-                    or tile.select_one("a")
-                )
-                if not name_el:
-                    continue
-
-                name = name_el.get_text(strip=True)
-                href = name_el.get("href", "")
-                if not name:
-                    continue
-
-                # --- SKU ---
-                sku = tile.get("data-product-id", "") or tile.get("data-sku", "")
-                if not sku and href:
-                    sku_match = re.search(r"/p/(\d+)", href) or re.search(r"/(\w+-\d+)", href)
-                    sku = sku_match.group(1) if sku_match else ""
-                if not sku:
-                    sku = f"aldi-{hash(name) % 1000000}"
-
-                # --- Price ---
-                price_el = tile.select_one(
-                    "span[class*='price'], "
-                    "span[class*='Price'], "
-                    "div[class*='price'], "
-                    "p[class*='price']"
-                )
-                price_text = price_el.get_text(strip=True) if price_el else ""
-                price = self._parse_price(price_text)
-                if price is None or price == 0:
-                    continue
-
-                # --- Promo ---
-                promo_label = None
-                promo_el = tile.select_one(
-                    "span[class*='offer'], "
-                    "span[class*='badge'], "
-                    "div[class*='badge'], "
-                    "span[class*='promo']"
-                )
-                if promo_el:
-                    promo_label = promo_el.get_text(strip=True) or None
-
-                # --- Image ---
-                image_url = None
-                img_el = tile.select_one("img")
-                if img_el:
-                    image_url = img_el.get("src") or img_el.get("data-src")
-                    if image_url and image_url.startswith("//"):
-                        image_url = f"https:{image_url}"
-                    elif image_url and image_url.startswith("/"):
-                        image_url = f"{BASE_URL}{image_url}"
-
-                # --- Unit size from name ---
-                unit_size = None
-                unit = None
-                size_match = re.search(
-                    r"(\d+(?:\.\d+)?)\s*(ml|l|g|kg|cl|pk|pack)\b", name, re.IGNORECASE
-                )
-                if size_match:
-                    try:
-                        unit_size = Decimal(size_match.group(1))
-                        unit = size_match.group(2).lower()
-                    except (InvalidOperation, ValueError):
-                        pass
-
-                product_url = href
-                if product_url and not product_url.startswith("http"):
-                    product_url = f"{BASE_URL}{product_url}"
-
-                # --- Brand ---
-                brand = None
-                brand_el = tile.select_one("span[class*='brand'], span[class*='Brand']")
-                if brand_el:
-                    brand = brand_el.get_text(strip=True)
-
-                products.append(
-                    RawProduct(
-                        store_sku=sku,
-                        name=name,
-                        price=price,
-                        promo_label=promo_label,
-                        unit_size=unit_size,
-                        unit=unit,
-                        brand=brand,
-                        image_url=image_url,
-                        product_url=product_url or None,
-                    )
-                )
-
-            except Exception:
-                logger.debug("[aldi] Failed to parse tile", exc_info=True)
-
-        return products
+        return self._client
+
+    def _unseen(
+        self, products: Iterable[RawProduct], category_skus: set[str]
+    ) -> Iterator[RawProduct]:
+        """Drop products already scraped by a finished category or this one.
+
+        Featured products repeat across pages and categories; the specials
+        page is not filtered so its promo details are always kept.  Passing
+        SKUs are recorded in *category_skus* only; :meth:`scrape_category`
+        adds them to the run-wide set once the category succeeds.  Products
+        that pass through have their repeated strings interned.
+        """
+        for product in products:
+            sku = product.store_sku
+            if sku not in self._seen_skus and sku not in category_skus:
+                category_skus.add(sku)
+                product.brand = _intern(product.brand)
+                product.promo_label = _intern(product.promo_label)
+                product.unit = _intern(product.unit)
+                yield product
+
+    def _get_parse_pool(self) -> ProcessPoolExecutor:
+        """Return the process pool used for parsing, creating it on first use.
+
+        Parsing is pure CPU, so pages from concurrent categories parse on
+        separate cores instead of queueing on the event loop.
+        """
+        if self._parse_pool is None:
+            workers = min(os.cpu_count() or 1, self.max_concurrency)
+            self._parse_pool = ProcessPoolExecutor(max_workers=workers)
+        return self._parse_pool
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        if self._parse_pool is not None:
+            self._parse_pool.shutdown(wait=False, cancel_futures=True)
+            self._parse_pool = None
+        self._seen_skus.clear()
+        await super().aclose()
 
     # ------------------------------------------------------------------
     # SAP Commerce OCC API interception
     # ------------------------------------------------------------------
-    async def _intercept_api(self, page: Page, url: str) -> list[dict]:
-        """Load a page while intercepting SAP Commerce OCC API responses."""
+    async def _intercept_api(self, page: Page, url: str, tile_selector: str) -> list[dict]:
+        """Load a page while intercepting SAP Commerce OCC API responses.
+
+        Returns once product tiles render or the first OCC response arrives
+        (at most 15s) instead of waiting for the network to go idle, which
+        analytics beacons can hold off indefinitely.  Responses that arrive
+        later, e.g. while scrolling, are still appended to the returned list.
+        """
         api_products: list[dict] = []
 
         async def handle_response(response: Response) -> None:
-            resp_url = response.url
-            if "/occ/" in resp_url or "/rest/" in resp_url:
+            if _is_occ_response(response):
                 try:
                     content_type = response.headers.get("content-type", "")
                     if "application/json" not in content_type:
                         return
-                    data = await response.json()
+                    data = orjson.loads(await response.body())
                     if isinstance(data, dict):
                         products = data.get("products", [])
                         if isinstance(products, list) and products:
@@ -278,103 +352,81 @@ class AldiScraper(BaseScraper):
                     pass
 
         page.on("response", handle_response)
-        await page.goto(url, wait_until="networkidle", timeout=60_000)
+        await page.goto(url, wait_until="domcontentloaded", timeout=60_000)
+
+        waiters = {
+            asyncio.ensure_future(page.wait_for_selector(tile_selector, timeout=15_000)),
+            asyncio.ensure_future(page.wait_for_response(_is_occ_response, timeout=15_000)),
+        }
+        done, pending = await asyncio.wait(waiters, return_when=asyncio.FIRST_COMPLETED)
+        for waiter in pending:
+            waiter.cancel()
+        for waiter in done:
+            if waiter.exception() is not None:
+                logger.debug("[aldi] Nothing rendered on %s within 15s", url)
         return api_products
 
     def _parse_occ_product(self, item: dict) -> RawProduct | None:
         """Parse a product from SAP Commerce OCC API response."""
-        code = item.get("code", "")
-        name = item.get("name", "")
+        get = item.get
+        code = get("code")
+        name = get("name")
         if not code or not name:
             return None
 
-        price_data = item.get("price", {})
-        price_val = price_data.get("value")
-        if price_val is None:
-            return None
-
-        try:
-            price = Decimal(str(price_val))
-        except (InvalidOperation, TypeError, ValueError):
+        price = _to_decimal((get("price") or {}).get("value"))
+        if not price:
             return None
 
-        if price == 0:
-            return None
-
-        # Promo / was-price
+        # Promo / was-price: the current price is the promo
         promo_price = None
         promo_label = None
-        was_price_data = item.get("wasPrice", {})
-        if was_price_data and was_price_data.get("value") is not None:
-            try:
-                promo_price = price  # current price is the promo
-                price = Decimal(str(was_price_data["value"]))
-                promo_label = item.get("promotionText") or "Special Offer"
-            except (InvalidOperation, TypeError, ValueError):
-                promo_price = None
-                promo_label = None
+        was_price = _to_decimal((get("wasPrice") or {}).get("value"))
+        if was_price is not None:
+            promo_price, price = price, was_price
+            promo_label = get("promotionText") or "Special Offer"
 
         # Unit price
         unit_price = None
         unit = None
-        unit_price_data = item.get("basePrice") or item.get("unitPrice")
+        unit_price_data = get("basePrice") or get("unitPrice")
         if isinstance(unit_price_data, dict):
-            try:
-                unit_price = Decimal(str(unit_price_data.get("value", "")))
-            except (InvalidOperation, TypeError, ValueError):
-                pass
+            unit_price = _to_decimal(unit_price_data.get("value"))
             unit = unit_price_data.get("unit", unit_price_data.get("currencyIso"))
 
         # Unit size from name
         unit_size = None
-        size_match = re.search(
-            r"(\d+(?:\.\d+)?)\s*(ml|l|g|kg|cl|pk|pack)\b", name, re.IGNORECASE
-        )
+        size_match = _RE_SIZE.search(name)
         if size_match:
-            try:
-                unit_size = Decimal(size_match.group(1))
-                unit = unit or size_match.group(2).lower()
-            except (InvalidOperation, ValueError):
-                pass
-
-        # Image
-        image_url = None
-        images = item.get("images", [])
-        if isinstance(images, list) and images:
-            for img in images:
-                if isinstance(img, dict) and img.get("url"):
-                    image_url = img["url"]
-                    if image_url.startswith("//"):
-                        image_url = f"https:{image_url}"
-                    elif image_url.startswith("/"):
-                        image_url = f"{BASE_URL}{image_url}"
-                    break
-
-        # Product URL
-        product_url = item.get("url", "")
-        if product_url and not product_url.startswith("http"):
-            product_url = f"{BASE_URL}{product_url}"
+            unit_size = Decimal(size_match.group(1))
+            unit = unit or size_match.group(2).lower()
+
+        # Image: first entry that carries a URL
+        image = next(
+            (img["url"] for img in get("images") or () if isinstance(img, dict) and img.get("url")),
+            None,
+        )
 
         # Brand
-        brand = None
-        brand_data = item.get("brand")
-        if isinstance(brand_data, dict):
-            brand = brand_data.get("name")
-        elif isinstance(brand_data, str):
-            brand = brand_data
+        brand = get("brand")
+        if isinstance(brand, dict):
+            brand = brand.get("name")
+        elif not isinstance(brand, str):
+            brand = None
 
+        href = get("url")
         return RawProduct(
             store_sku=str(code),
             name=name.strip(),
             price=price,
             promo_price=promo_price,
-            promo_label=promo_label,
+            promo_label=_intern(promo_label),
             unit_price=unit_price,
-            unit=unit,
+            unit=_intern(unit),
             unit_size=unit_size,
-            brand=brand,
-            image_url=image_url or None,
-            product_url=product_url or None,
+            brand=_intern(brand),
+            image_url=_absolute_url(BASE_URL, image) if image else None,
+            product_url=_absolute_url(BASE_URL, href) if href else None,
         )
 
     # ------------------------------------------------------------------
@@ -384,17 +436,14 @@ class AldiScraper(BaseScraper):
         """Fall back to Playwright when httpx cannot get the data."""
         products: list[RawProduct] = []
 
-        pw, browser, context = await self._get_browser_context(headless=True)
-        try:
-            page = await context.new_page()
+        async with self._pooled_page() as page:
             logger.info("[aldi] Playwright loading %s", category_url)
 
             # Try to intercept OCC API responses while loading the page
-            api_products = await self._intercept_api(page, category_url)
-            await asyncio.sleep(3)
+            api_products = await self._intercept_api(page, category_url, _TILE_SELECTOR)
 
             await self._dismiss_overlays(page)
-            await self._scroll_page(page)
+            await self._scroll_page(page, _TILE_SELECTOR)
 
             # Parse products from intercepted API data first
             if api_products:
@@ -410,14 +459,13 @@ class AldiScraper(BaseScraper):
             # Fall back to DOM scraping if API interception yielded nothing
             if not products:
                 logger.info("[aldi] Falling back to DOM scraping for %s", category_url)
+                await self._wait_for_tiles(page, _TILE_SELECTOR)
                 html = await page.content()
-                soup = BeautifulSoup(html, "html.parser")
-                products = self._parse_html(soup, category_url)
+                products, _ = await asyncio.get_running_loop().run_in_executor(
+                    self._get_parse_pool(), _parse_page, html, page.url
+                )
 
-        finally:
-            await context.close()
-            await browser.close()
-            await pw.stop()
+            products = list(self._unseen(products, set()))
 
         return products
 
@@ -428,17 +476,14 @@ class AldiScraper(BaseScraper):
         """Scrape the Aldi specials page (JS-rendered)."""
         products: list[RawProduct] = []
 
-        pw, browser, context = await self._get_browser_context(headless=True)
-        try:
-            page = await context.new_page()
+        async with self._pooled_page() as page:
             logger.info("[aldi] Loading special offers %s", url)
 
             # Try to intercept OCC API responses while loading the page
-            api_products = await self._intercept_api(page, url)
-            await asyncio.sleep(3)
+            api_products = await self._intercept_api(page, url, _SPECIAL_TILES)
 
             await self._dismiss_overlays(page)
-            await self._scroll_page(page, scrolls=8)
+            await self._scroll_page(page, _SPECIAL_TILES, max_scrolls=8)
 
             # Parse products from intercepted API data first
             if api_products:
@@ -456,44 +501,39 @@ class AldiScraper(BaseScraper):
             # Fall back to DOM scraping if API interception yielded nothing
             if not products:
                 logger.info("[aldi] Falling back to DOM scraping for specials")
-                # Special offer tiles
-                tiles = page.locator(
-                    "div[class*='SpecialBuy'], "
-                    "div[class*='product-tile'], "
-                    "div[data-qa='special-buy-tile'], "
-                    "article[class*='product']"
+                await self._wait_for_tiles(page, _SPECIAL_TILES)
+                # Read every tile in one round-trip instead of several per tile
+                rows = await page.evaluate(
+                    '''([tileSel, nameSel, priceSel]) => {
+                    return [...document.querySelectorAll(tileSel)].map(tile => {
+                        const name = tile.querySelector(nameSel);
+                        const price = tile.querySelector(priceSel);
+                        const img = tile.querySelector('img');
+                        return {
+                            name: name ? name.innerText : '',
+                            price: price ? price.innerText : '',
+                            image: img ? img.getAttribute('src') : null,
+                        };
+                    });
+                }''',
+                    [_SPECIAL_TILES, _SPECIAL_NAME, _SPECIAL_PRICE],
                 )
-                count = await tiles.count()
-                logger.info("[aldi] Found %d special offer tiles", count)
+                logger.info("[aldi] Found %d special offer tiles", len(rows))
 
-                for i in range(count):
+                for i, row in enumerate(rows):
                     try:
-                        tile = tiles.nth(i)
-
-                        name_el = tile.locator("h4, h3, a[class*='Title'], p[class*='title']")
-                        name = ""
-                        if await name_el.count() > 0:
-                            name = (await name_el.first.inner_text()).strip()
+                        name = (row.get("name") or "").strip()
                         if not name:
                             continue
 
-                        price_el = tile.locator("span[class*='price'], span[class*='Price']")
-                        price_text = ""
-                        if await price_el.count() > 0:
-                            price_text = await price_el.first.inner_text()
-                        price = self._parse_price(price_text)
+                        price = _parse_price(row.get("price") or "")
                         if price is None or price == 0:
                             continue
 
-                        sku = f"aldi-offer-{hash(name) % 1000000}"
+                        sku = f"aldi-offer-{stable_hash(name)}"
 
-                        # Image
-                        image_url = None
-                        img_el = tile.locator("img")
-                        if await img_el.count() > 0:
-                            image_url = await img_el.first.get_attribute("src")
-                            if image_url and not image_url.startswith("http"):
-                                image_url = f"{BASE_URL}{image_url}"
+                        image = row.get("image")
+                        image_url = _absolute_url(url, image) if image else None
 
                         products.append(
                             RawProduct(
@@ -507,50 +547,278 @@ class AldiScraper(BaseScraper):
                     except Exception:
                         logger.debug("[aldi] Failed to parse special offer tile %d", i, exc_info=True)
 
-        finally:
-            await context.close()
-            await browser.close()
-            await pw.stop()
-
         return products
 
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
+    async def _open_context(self) -> BrowserContext:
+        """Open a browser context that only lets aldi.ie answer XHR / fetch calls.
+
+        Images, fonts and stylesheets are already dropped by the base context;
+        third-party API calls (analytics, personalisation, chat) are dropped
+        here since only the OCC responses are read.
+        """
+        context = await self._new_context(block_stylesheets=True, block_service_workers=True)
+        await context.route("**/*", _block_third_party_api)
+        return context
+
     @staticmethod
-    def _parse_price(text: str) -> Decimal | None:
-        if not text:
-            return None
-        cleaned = re.sub(r"[^\d.,]", "", text.strip())
-        cleaned = cleaned.replace(",", ".")
+    async def _wait_for_tiles(page: Page, tile_selector: str) -> None:
+        """Wait until the first product tile is rendered (at most 10s)."""
         try:
-            return Decimal(cleaned) if cleaned else None
-        except InvalidOperation:
-            return None
+            await page.wait_for_selector(tile_selector, timeout=10_000)
+        except PlaywrightTimeoutError:
+            logger.debug("[aldi] No tiles rendered on %s", page.url)
 
     @staticmethod
     async def _dismiss_overlays(page: Page) -> None:
-        for selector in [
-            "button:has-text('Accept All')",
-            "button:has-text('Accept Cookies')",
-            "button:has-text('Accept')",
-            "button[id*='onetrust-accept']",
-            "button[class*='cookie-accept']",
-        ]:
-            try:
-                btn = page.locator(selector)
-                if await btn.count() > 0 and await btn.first.is_visible():
-                    await btn.first.click()
-                    await asyncio.sleep(0.5)
-                    break
-            except Exception:
-                pass
+        # One round-trip when there is nothing to dismiss
+        button = page.locator(f"{_OVERLAY_BUTTONS} >> visible=true").first
+        try:
+            if await button.count() > 0:
+                await button.click(timeout=1_500)
+                await asyncio.sleep(0.3)
+        except Exception:
+            pass
 
     @staticmethod
-    async def _scroll_page(page: Page, scrolls: int = 5) -> None:
-        for _ in range(scrolls):
-            await page.evaluate("window.scrollBy(0, window.innerHeight)")
-            await asyncio.sleep(0.6)
+    async def _scroll_page(page: Page, tile_selector: str, max_scrolls: int = 5) -> None:
+        """Scroll to trigger lazy loading until the tile count stops growing.
+
+        The whole loop runs in the page, so it costs a single round-trip.
+        """
+        await page.evaluate(
+            '''async ([tileSel, maxScrolls]) => {
+            const countTiles = () => document.querySelectorAll(tileSel).length;
+            let count = countTiles();
+            let unchanged = 0;
+            for (let i = 0; i < maxScrolls; i++) {
+                window.scrollBy(0, window.innerHeight);
+                await new Promise(resolve => setTimeout(resolve, 300));
+                const newCount = countTiles();
+                unchanged = newCount === count ? unchanged + 1 : 0;
+                if (unchanged >= 2) break;
+                count = newCount;
+            }
+        }''',
+            [tile_selector, max_scrolls],
+        )
+
+
+# ------------------------------------------------------------------
+# Request routing
+# ------------------------------------------------------------------
+def _is_occ_response(response: Response) -> bool:
+    """Whether *response* comes from the SAP Commerce OCC / REST API."""
+    url = response.url
+    return "/occ/" in url or "/rest/" in url
+
+
+async def _block_third_party_api(route: Route) -> None:
+    """Abort XHR / fetch requests to hosts other than aldi.ie."""
+    request = route.request
+    if request.resource_type in ("xhr", "fetch"):
+        host = urlsplit(request.url).hostname or ""
+        if not (host == "aldi.ie" or host.endswith(".aldi.ie")):
+            await route.abort()
+            return
+    # Hand over to the base context's resource blocking
+    await route.fallback()
+
+
+# ------------------------------------------------------------------
+# Page parsing (module level so it can run in worker processes)
+# ------------------------------------------------------------------
+def _parse_page(html: bytes | str, page_url: str) -> tuple[list[RawProduct], str | None]:
+    """Parse the product tiles on one category page, and its next-page URL.
+
+    Relative links and image paths are resolved against *page_url*.
+    Products already scraped from other pages are dropped by the caller.
+
+    Runs in the parse pool, so it must stay a picklable module-level function.
+    Pass raw response bytes where possible: lxml sniffs the charset itself,
+    which saves decoding the page to ``str`` first.
+    """
+    try:
+        tree = lxml_html.fromstring(html)
+    except etree.ParserError:
+        return [], None
+    # Fall back to broader selectors if the usual tile markup is missing
+    tiles = _XPATH_TILES(tree) or _XPATH_TILES_FALLBACK(tree)
+    products = list(_iter_tile_products(tiles, page_url))
+
+    hrefs = _XPATH_NEXT_HREF(tree)
+    next_url = urljoin(page_url, str(hrefs[0])) if hrefs and hrefs[0] else None
+    return products, next_url
+
+
+def _text(element: lxml_html.HtmlElement) -> str:
+    """Concatenate the stripped text nodes under *element*.
+
+    Same result as BeautifulSoup's ``get_text(strip=True)``.
+    """
+    return "".join(part.strip() for part in element.itertext())
+
+
+def _iter_tile_products(
+    tiles: list[lxml_html.HtmlElement], page_url: str
+) -> Iterator[RawProduct]:
+    """Yield products from Aldi product tiles, skipping SKUs repeated on the page."""
+    skus: set[str] = set()
+
+    for tile in tiles:
+        try:
+            # --- Name + link ---
+            name_els = _XPATH_NAME(tile) or _XPATH_LINK(tile)
+            if not name_els:
+                continue
+
+            name_el = name_els[0]
+            name = _text(name_el)
+            href = name_el.get("href", "")
+            if not name:
+                continue
+
+            # --- SKU ---
+            sku = tile.get("data-product-id", "") or tile.get("data-sku", "")
+            if not sku and href:
+                sku_match = _RE_SKU_P.search(href) or _RE_SKU_SLUG.search(href)
+                sku = sku_match.group(1) if sku_match else ""
+            if not sku:
+                sku = f"aldi-{stable_hash(name)}"
+            if sku in skus:
+                continue
+
+            # --- Price ---
+            price_els = _XPATH_PRICE(tile)
+            price_text = _text(price_els[0]) if price_els else ""
+            price = _parse_price(price_text)
+            if price is None or price == 0:
+                continue
+
+            # --- Promo + brand: first match of each, in document order ---
+            promo_el = brand_el = None
+            for el in _XPATH_BADGES(tile):
+                cls = el.get("class", "")
+                if promo_el is None and (el.tag == "div" or _RE_PROMO_CLASS.search(cls)):
+                    promo_el = el
+                if brand_el is None and el.tag == "span" and _RE_BRAND_CLASS.search(cls):
+                    brand_el = el
+            promo_label = None
+            if promo_el is not None:
+                promo_label = _text(promo_el) or None
+
+            # --- Image ---
+            image_url = None
+            img_els = _XPATH_IMG(tile)
+            if img_els:
+                src = img_els[0].get("src") or img_els[0].get("data-src")
+                image_url = _absolute_url(page_url, src) if src else None
+
+            # --- Unit size from name ---
+            unit_size = None
+            unit = None
+            size_match = _RE_SIZE.search(name)
+            if size_match:
+                try:
+                    unit_size = Decimal(size_match.group(1))
+                    unit = size_match.group(2).lower()
+                except (InvalidOperation, ValueError):
+                    pass
+
+            product_url = _absolute_url(page_url, href) if href else None
+
+            # --- Brand ---
+            brand = _text(brand_el) if brand_el is not None else None
+
+            skus.add(sku)
+            yield RawProduct(
+                store_sku=sku,
+                name=name,
+                price=price,
+                promo_label=_intern(promo_label),
+                unit_size=unit_size,
+                unit=_intern(unit),
+                brand=_intern(brand),
+                image_url=image_url,
+                product_url=product_url,
+            )
+
+        except Exception:
+            logger.debug("[aldi] Failed to parse tile", exc_info=True)
+
+
+# Brand / promo / unit strings take a few dozen values across thousands of
+# products; each process keeps one shared instance per value.  Interning in
+# the parse workers also lets pickle send each value once per batch.
+_INTERN: dict[str, str] = {}
+
+
+def _intern(value: str | None) -> str | None:
+    """Return the shared instance of *value*."""
+    return None if value is None else _INTERN.setdefault(value, value)
+
+
+@lru_cache(maxsize=16)
+def _origin(url: str) -> str:
+    """Return the ``scheme://host`` part of *url*."""
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
+
+
+def _absolute_url(base: str, href: str) -> str:
+    """Resolve *href* against *base*, like ``urljoin``.
+
+    Absolute and root-relative links (nearly every link on aldi.ie) skip
+    the comparatively slow pure-Python ``urljoin``.
+    """
+    if href.startswith(("https://", "http://")):
+        return href
+    if href.startswith("/") and not href.startswith("//") and "/." not in href:
+        return _origin(base) + href
+    return urljoin(base, href)
+
+
+def _to_decimal(value: object) -> Decimal | None:
+    """Convert an OCC API number (float, int or numeric string) to a Decimal.
+
+    Anything else (``None``, or a dict / list where a number was expected)
+    gives ``None``; it must not reach the cache, which would fail to hash it.
+    """
+    if not isinstance(value, (int, float, str)):
+        return None
+    return _cached_decimal(value)
+
+
+@lru_cache(maxsize=4096, typed=True)
+def _cached_decimal(value: int | float | str) -> Decimal | None:
+    """Cached body of :func:`_to_decimal`.
+
+    A category has only a few hundred distinct prices, so conversions are
+    cached; ``typed`` keeps ``1`` and ``1.0`` apart so their exponents match
+    what ``Decimal(str(value))`` would give.
+    """
+    try:
+        return Decimal(str(value))
+    except (InvalidOperation, TypeError, ValueError):
+        return None
+
+
+@lru_cache(maxsize=1024)
+def _parse_price(text: str) -> Decimal | None:
+    """Parse a displayed price such as ``€1,49`` into a Decimal.
+
+    Price strings repeat heavily across tiles, and Decimals are immutable,
+    so results are cached.
+    """
+    if not text:
+        return None
+    cleaned = text.strip().translate(_PRICE_CHARS).replace(",", ".")
+    try:
+        return Decimal(cleaned) if cleaned else None
+    except InvalidOperation:
+        return None
 
 
 # ------------------------------------------------------------------
@@ -568,15 +836,19 @@ async def main() -> None:
         # Dry-run mode: scrape categories and print products without hitting the DB
         scraper = AldiScraper()
         category_urls = await scraper.get_category_urls()
-        all_products: list[RawProduct] = []
-        for url in category_urls:
-            try:
-                products = await scraper.scrape_category(url)
-                all_products.extend(products)
-                print(f"[dry-run] {url} -> {len(products)} products")
-            except Exception as exc:
-                print(f"[dry-run] {url} -> ERROR: {exc}")
-            await random_delay(1.0, 3.0)
+        # Keyed by SKU: specials can repeat products already seen in a category
+        by_sku: dict[str, RawProduct] = {}
+        try:
+            outcomes = await scraper.scrape_all(category_urls)
+        finally:
+            await scraper.aclose()
+        for url, outcome in zip(category_urls, outcomes):
+            if isinstance(outcome, BaseException):
+                print(f"[dry-run] {url} -> ERROR: {outcome}")
+            else:
+                by_sku.update((p.store_sku, p) for p in outcome)
+                print(f"[dry-run] {url} -> {len(outcome)} products")
+        all_products = list(by_sku.values())
 
         print(f"\n[dry-run] Total products scraped: {len(all_products)}")
         for p in all_products[:20]:
@@ -587,7 +859,7 @@ async def main() -> None:
         scraper = AldiScraper()
         result = await scraper.run()
         print(f"\nDone: {result.status}")
-        print(f"Products scraped: {len(result.products)}")
+        print(f"Products scraped: {result.products_scraped}")
         if result.errors:
             print(f"Errors ({len(result.errors)}):")
             for err in result.errors:
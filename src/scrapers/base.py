@@ -3,20 +3,32 @@
 from __future__ import annotations
 
 import asyncio
-import json
+import hashlib
 import logging
 import random
 from abc import ABC, abstractmethod
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 from datetime import datetime
-from decimal import Decimal
-
-from playwright.async_api import async_playwright, BrowserContext
+from decimal import Decimal, InvalidOperation
+
+import orjson
+from playwright.async_api import (
+    async_playwright,
+    Browser,
+    BrowserContext,
+    Page,
+    Playwright,
+    Route,
+)
 from playwright_stealth import Stealth
-from sqlalchemy import select
+from sqlalchemy import func, insert, select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
 
-from src.core.database import async_session
+from src.core.database import BULK_CHUNK, async_session
 from src.core.models import Category, PriceRecord, Product, ScrapeRun, Store, StoreProduct
 
 logger = logging.getLogger(__name__)
@@ -44,12 +56,101 @@ DEFAULT_HEADERS = {
     "Upgrade-Insecure-Requests": "1",
 }
 
+# Requests aborted by ``_get_browser_context(block_resources=True)``: nothing
+# we parse depends on loaded bitmaps, fonts or analytics beacons.
+BLOCKED_RESOURCE_TYPES = frozenset({"image", "media", "font"})
+BLOCKED_URL_FRAGMENTS = (
+    "google-analytics",
+    "googletagmanager",
+    "gtag",
+    "doubleclick",
+    "facebook",
+    "hotjar",
+    "optimizely",
+)
+
+# Values per ``IN (...)`` lookup in save_results (asyncpg allows 32767 binds)
+IN_CLAUSE_CHUNK = 5000
+
+# Batches of at least this many price records are written with COPY
+COPY_THRESHOLD = 100
+PRICE_RECORD_COLUMNS = (
+    "store_product_id",
+    "price",
+    "promo_price",
+    "promo_label",
+    "unit_price",
+    "in_stock",
+)
+
 
 def random_user_agent() -> str:
     """Pick a random user-agent string."""
     return random.choice(USER_AGENTS)
 
 
+def stable_hash(text: str) -> str:
+    """Return a 64-bit hex digest of *text* that is stable across runs.
+
+    Used for fallback SKUs; unlike ``hash()`` it is not salted per process.
+    """
+    return hashlib.blake2b(text.encode(), digest_size=8).hexdigest()
+
+
+def _category_slug(name: str) -> str:
+    """Slug used to look up / create a ``Category`` from a scraped name."""
+    return name.lower().replace(" ", "-").replace("&", "and")
+
+
+# RawProduct fields and the columns save_results writes them to, used to
+# reject rows the database would refuse before they reach a bulk statement
+_STRING_COLUMNS = {
+    "store_sku": StoreProduct.__table__.c.store_sku,
+    "name": Product.__table__.c.name,
+    "promo_label": PriceRecord.__table__.c.promo_label,
+    "unit": Product.__table__.c.unit,
+    "brand": Product.__table__.c.brand,
+    "ean": Product.__table__.c.ean,
+    "category": Category.__table__.c.name,
+    "image_url": Product.__table__.c.image_url,
+    "product_url": StoreProduct.__table__.c.store_url,
+}
+_NUMERIC_COLUMNS = {
+    "price": PriceRecord.__table__.c.price,
+    "promo_price": PriceRecord.__table__.c.promo_price,
+    "unit_price": PriceRecord.__table__.c.unit_price,
+    "unit_size": Product.__table__.c.unit_size,
+}
+
+
+def _unsaveable_reason(raw: RawProduct) -> str | None:
+    """Return why *raw* cannot be stored, or ``None`` if it can."""
+    if not raw.store_sku:
+        return "no store_sku"
+    if not raw.name:
+        return "no name"
+    if raw.price is None:
+        return "no price"
+    for attr, column in _STRING_COLUMNS.items():
+        value = getattr(raw, attr)
+        if value is not None and len(value) > column.type.length:
+            return f"{attr} longer than {column.type.length} characters"
+    if raw.category and len(_category_slug(raw.category)) > Category.__table__.c.slug.type.length:
+        return "category slug too long"
+    for attr, column in _NUMERIC_COLUMNS.items():
+        value = getattr(raw, attr)
+        if value is None:
+            continue
+        try:
+            number = Decimal(value)
+        except (InvalidOperation, TypeError, ValueError):
+            return f"{attr} is not a number"
+        limit = 10 ** (column.type.precision - column.type.scale)
+        if not number.is_finite() or abs(number) >= limit:
+            return f"{attr} out of range"
+    return None
+
+
 async def random_delay(min_seconds: float = 1.0, max_seconds: float = 3.0) -> None:
     """Sleep for a random duration between *min_seconds* and *max_seconds*."""
     delay = random.uniform(min_seconds, max_seconds)
@@ -60,9 +161,12 @@ async def random_delay(min_seconds: float = 1.0, max_seconds: float = 3.0) -> No
 # ---------------------------------------------------------------------------
 # Data classes
 # ---------------------------------------------------------------------------
-@dataclass
+@dataclass(slots=True)
 class RawProduct:
-    """Intermediate representation of a product scraped from a store."""
+    """Intermediate representation of a product scraped from a store.
+
+    Slotted: a full run holds tens of thousands of these in memory.
+    """
 
     store_sku: str
     name: str
@@ -87,14 +191,18 @@ class ScrapeResult:
     store_slug: str
     products: list[RawProduct] = field(default_factory=list)
     errors: list[str] = field(default_factory=list)
+    # Products scraped by run(), which saves them per category instead of
+    # collecting them in ``products``
+    products_scraped: int = 0
     started_at: datetime = field(default_factory=datetime.utcnow)
     finished_at: datetime = field(default_factory=datetime.utcnow)
 
     @property
     def status(self) -> str:
-        if not self.products and self.errors:
+        scraped = bool(self.products or self.products_scraped)
+        if not scraped and self.errors:
             return "failed"
-        if self.products and self.errors:
+        if scraped and self.errors:
             return "partial"
         return "success"
 
@@ -103,6 +211,34 @@ class ScrapeResult:
         return (self.finished_at - self.started_at).total_seconds()
 
 
+# ---------------------------------------------------------------------------
+# Process-wide browser
+# ---------------------------------------------------------------------------
+_shared_browser: tuple[Playwright, Browser] | None = None
+
+
+async def start_shared_browser() -> None:
+    """Launch Chromium up front for a long-running process (the scheduler).
+
+    Scrapers run afterwards borrow this browser instead of launching their
+    own, which takes the cold start off every run.
+    """
+    global _shared_browser
+    if _shared_browser is None:
+        _shared_browser = await BaseScraper._launch_browser(headless=True)
+        logger.info("Shared browser started")
+
+
+async def stop_shared_browser() -> None:
+    """Close the browser started by :func:`start_shared_browser`."""
+    global _shared_browser
+    if _shared_browser is not None:
+        pw, browser = _shared_browser
+        _shared_browser = None
+        await browser.close()
+        await pw.stop()
+
+
 # ---------------------------------------------------------------------------
 # Abstract base scraper
 # ---------------------------------------------------------------------------
@@ -117,6 +253,23 @@ class BaseScraper(ABC):
 
     store_slug: str
 
+    #: How many categories :meth:`scrape_all` may scrape at the same time.
+    max_concurrency: int = 1
+    #: Sleep a random 1-3s after each category.  Concurrent scrapers can turn
+    #: this off: parallel workers already stagger their requests.  Delays
+    #: between pages of one category are up to each scraper and unaffected.
+    delay_enabled: bool = True
+
+    # Shared browser, launched by _ensure_browser() and closed by aclose();
+    # _pw stays None while the browser is borrowed from start_shared_browser()
+    _pw: Playwright | None = None
+    _browser: Browser | None = None
+    _browser_lock: asyncio.Lock | None = None
+    # Idle contexts handed out by _pooled_page(); at most max_concurrency exist
+    _context_pool: asyncio.Queue[BrowserContext] | None = None
+    # Category slug -> id, filled in by save_results() over the run
+    _category_ids: dict[str, int] | None = None
+
     # ------------------------------------------------------------------
     # Public API
     # ------------------------------------------------------------------
@@ -144,57 +297,62 @@ class BaseScraper(ABC):
             await session.commit()
             scrape_run_id = scrape_run.id
 
+        # Each category's products are saved while the next ones are scraped
+        chunks: asyncio.Queue[list[RawProduct] | None] = asyncio.Queue()
+        saver = asyncio.create_task(self._save_chunks(chunks, result))
+
         try:
             category_urls = await self.get_category_urls()
             logger.info("[%s] Found %d category URLs", self.store_slug, len(category_urls))
 
-            for url in category_urls:
-                try:
-                    products = await self.scrape_category(url)
-                    result.products.extend(products)
-                    logger.info(
-                        "[%s] Scraped %d products from %s",
-                        self.store_slug,
-                        len(products),
-                        url,
-                    )
-                except Exception as exc:
-                    msg = f"Error scraping {url}: {exc}"
-                    logger.exception(msg)
+            outcomes = await self.scrape_all(category_urls, sink=chunks.put_nowait)
+            for url, outcome in zip(category_urls, outcomes):
+                # gather() also returns CancelledError and other BaseExceptions
+                if isinstance(outcome, BaseException):
+                    msg = f"Error scraping {url}: {outcome}"
+                    logger.error(msg, exc_info=outcome)
                     result.errors.append(msg)
-
-                await random_delay(1.0, 3.0)
+                    continue
+                result.products_scraped += outcome
+                logger.info(
+                    "[%s] Scraped %d products from %s",
+                    self.store_slug,
+                    outcome,
+                    url,
+                )
 
         except Exception as exc:
             msg = f"Fatal error during scrape: {exc}"
             logger.exception(msg)
             result.errors.append(msg)
+        finally:
+            chunks.put_nowait(None)
+            await self.aclose()
 
         result.finished_at = datetime.utcnow()
+        try:
+            await saver
+        except Exception as exc:
+            # Still finalize the ScrapeRun below instead of leaving it "running"
+            msg = f"Error saving results: {exc}"
+            logger.exception(msg)
+            result.errors.append(msg)
 
-        # Persist products and update scrape run
+        # Update scrape run record
         async with async_session() as session:
-            try:
-                await self.save_results(result.products, session)
-            except Exception as exc:
-                msg = f"Error saving results: {exc}"
-                logger.exception(msg)
-                result.errors.append(msg)
-
-            # Update scrape run record
             run = await session.get(ScrapeRun, scrape_run_id)
             if run:
                 run.finished_at = result.finished_at
                 run.status = result.status
-                run.products_scraped = len(result.products)
-                run.errors = json.dumps(result.errors) if result.errors else None
+                run.products_scraped = result.products_scraped
+                run.errors = orjson.dumps(result.errors).decode() if result.errors else None
                 await session.commit()
 
         logger.info(
             "[%s] Scrape finished: status=%s  products=%d  errors=%d  duration=%.1fs",
             self.store_slug,
             result.status,
-            len(result.products),
+            result.products_scraped,
             len(result.errors),
             result.duration_seconds,
         )
@@ -211,6 +369,74 @@ class BaseScraper(ABC):
     async def scrape_category(self, category_url: str) -> list[RawProduct]:
         """Scrape all products from a single category page/URL."""
 
+    async def scrape_all(
+        self,
+        category_urls: list[str],
+        sink: Callable[[list[RawProduct]], None] | None = None,
+    ) -> list[list[RawProduct] | int | BaseException]:
+        """Scrape every URL, at most ``max_concurrency`` categories at a time.
+
+        Returns one entry per URL, in order: the scraped products, or the
+        exception that category raised.  With a *sink*, each category's
+        products are handed to it as soon as they are scraped and the entry
+        is their count, so the lists are not held until every URL is done.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        async def _scrape_one(url: str) -> list[RawProduct] | int:
+            async with semaphore:
+                try:
+                    products = await self.scrape_category(url)
+                    if sink is None:
+                        return products
+                    sink(products)
+                    return len(products)
+                finally:
+                    if self.delay_enabled:
+                        await random_delay(1.0, 3.0)
+
+        return await asyncio.gather(
+            *(_scrape_one(url) for url in category_urls), return_exceptions=True
+        )
+
+    async def _save_chunks(
+        self, chunks: asyncio.Queue[list[RawProduct] | None], result: ScrapeResult
+    ) -> None:
+        """Save each queued category's products until ``None`` is queued.
+
+        Chunks are saved one at a time so two sessions never insert the
+        same new SKU concurrently; a failed chunk is recorded in *result*.
+        """
+        while (products := await chunks.get()) is not None:
+            if not products:
+                continue
+            async with async_session() as session:
+                try:
+                    await self.save_results(products, session)
+                except Exception as exc:
+                    msg = f"Error saving results: {exc}"
+                    logger.exception(msg)
+                    result.errors.append(msg)
+
+    async def aclose(self) -> None:
+        """Release resources held across categories (clients, browsers).
+
+        Called by :meth:`run` once every category has been scraped.
+        Sub-classes holding their own resources must call ``super().aclose()``.
+        """
+        pool, self._context_pool = self._context_pool, None
+        if self._browser is not None:
+            if self._pw is None:
+                # Borrowed from start_shared_browser(): close only our contexts
+                while pool is not None and not pool.empty():
+                    await pool.get_nowait().close()
+            else:
+                await self._browser.close()
+            self._browser = None
+        if self._pw is not None:
+            await self._pw.stop()
+            self._pw = None
+
     # ------------------------------------------------------------------
     # Persistence helpers
     # ------------------------------------------------------------------
@@ -219,102 +445,208 @@ class BaseScraper(ABC):
     ) -> None:
         """Persist scraped products.
 
-        For each ``RawProduct``:
+        Lookups are batched, so the number of round-trips does not grow with
+        the number of products:
+
         1. Find the ``Store`` by *self.store_slug*.
-        2. Try to find an existing ``StoreProduct`` by *(store_id, store_sku)*.
-        3. If none exists, optionally try matching by EAN.
-        4. Create ``Product`` / ``StoreProduct`` as needed.
-        5. Always create a new ``PriceRecord``.
+        2. Load ``(store_sku, product_id)`` of the existing ``StoreProduct``
+           rows for every *store_sku* in the batch with one ``IN (...)`` query.
+        3. For new SKUs, load ``Product`` rows by EAN the same way, and
+           ``Category`` ids for slugs this scraper has not saved before.
+        4. Create missing ``Category`` / ``Product`` rows in a single flush.
+        5. Upsert every ``StoreProduct`` with ``INSERT ... ON CONFLICT DO
+           UPDATE ... RETURNING id``: new listings are inserted, existing ones
+           get their latest name / URL, and both return their ids.
+        6. Always create a new ``PriceRecord``, all in one statement (``COPY``
+           for large batches).
+
+        The batch is saved in one transaction, so any database error loses
+        the whole batch.  Products the schema would reject (no SKU, name or
+        price, text longer than its column, numbers beyond its precision)
+        are therefore logged and skipped up front.
         """
         store = await self._get_store(session)
         if store is None:
             logger.error("Store '%s' not found – cannot save results", self.store_slug)
             return
 
-        saved = 0
+        scraped = len(products)
+        saveable = []
         for raw in products:
-            try:
-                # ---- try to find existing StoreProduct ----
-                stmt = select(StoreProduct).where(
-                    StoreProduct.store_id == store.id,
-                    StoreProduct.store_sku == raw.store_sku,
+            reason = _unsaveable_reason(raw)
+            if reason is None:
+                saveable.append(raw)
+            else:
+                logger.warning(
+                    "[%s] Skipping product %r: %s", self.store_slug, raw.store_sku, reason
                 )
-                result = await session.execute(stmt)
-                store_product = result.scalar_one_or_none()
-
-                if store_product is None:
-                    # Try to match by EAN if available
-                    product: Product | None = None
-                    if raw.ean:
-                        stmt_ean = select(Product).where(Product.ean == raw.ean)
-                        res_ean = await session.execute(stmt_ean)
-                        product = res_ean.scalar_one_or_none()
-
-                    # Resolve category if given
-                    category_id: int | None = None
-                    if raw.category:
-                        cat_slug = raw.category.lower().replace(" ", "-").replace("&", "and")
-                        stmt_cat = select(Category).where(Category.slug == cat_slug)
-                        res_cat = await session.execute(stmt_cat)
-                        category = res_cat.scalar_one_or_none()
-                        if category is None:
-                            category = Category(name=raw.category, slug=cat_slug)
-                            session.add(category)
-                            await session.flush()
-                        category_id = category.id
-
-                    if product is None:
-                        product = Product(
-                            name=raw.name,
-                            brand=raw.brand,
-                            ean=raw.ean,
-                            category_id=category_id,
-                            unit=raw.unit,
-                            unit_size=raw.unit_size,
-                            image_url=raw.image_url,
-                        )
-                        session.add(product)
-                        await session.flush()
-
-                    store_product = StoreProduct(
-                        product_id=product.id,
-                        store_id=store.id,
-                        store_sku=raw.store_sku,
-                        store_name=raw.name,
-                        store_url=raw.product_url,
-                        is_active=True,
-                    )
-                    session.add(store_product)
-                    await session.flush()
-                else:
-                    # Update existing StoreProduct metadata
-                    store_product.store_name = raw.name
-                    if raw.product_url:
-                        store_product.store_url = raw.product_url
-                    store_product.is_active = True
-
-                # ---- Always create a price record ----
-                price_record = PriceRecord(
-                    store_product_id=store_product.id,
-                    price=raw.price,
-                    promo_price=raw.promo_price,
-                    promo_label=raw.promo_label,
-                    unit_price=raw.unit_price,
-                    in_stock=raw.in_stock,
-                )
-                session.add(price_record)
-                saved += 1
+        products = saveable
+
+        # ---- existing StoreProducts: sku -> product_id ----
+        existing: dict[str, int] = dict(
+            await self._select_in(
+                session,
+                StoreProduct.store_sku,
+                {raw.store_sku for raw in products},
+                StoreProduct.store_id == store.id,
+                columns=(StoreProduct.store_sku, StoreProduct.product_id),
+            )
+        )
 
-            except Exception:
-                logger.exception(
-                    "[%s] Failed to save product sku=%s name=%s",
-                    self.store_slug,
-                    raw.store_sku,
-                    raw.name,
+        # One listing row per SKU with its latest metadata, and the first
+        # occurrence of every SKU we have not stored before
+        listings: dict[str, dict] = {}
+        new_raws: dict[str, RawProduct] = {}
+        for raw in products:
+            listing = listings.get(raw.store_sku)
+            if listing is None:
+                listings[raw.store_sku] = {
+                    "product_id": existing.get(raw.store_sku),
+                    "store_id": store.id,
+                    "store_sku": raw.store_sku,
+                    "store_name": raw.name,
+                    "store_url": raw.product_url,
+                    "is_active": True,
+                }
+                if raw.store_sku not in existing:
+                    new_raws[raw.store_sku] = raw
+            else:
+                listing["store_name"] = raw.name
+                if raw.product_url:
+                    listing["store_url"] = raw.product_url
+
+        # ---- match by EAN, resolve categories ----
+        products_by_ean: dict[str, Product] = {}
+        for product in await self._select_in(
+            session, Product.ean, {raw.ean for raw in new_raws.values() if raw.ean}
+        ):
+            products_by_ean.setdefault(product.ean, product)
+
+        # Category ids are remembered across the run's per-category saves,
+        # so only slugs not seen before are looked up
+        if self._category_ids is None:
+            self._category_ids = {}
+        category_ids = self._category_ids
+        wanted = {_category_slug(raw.category) for raw in new_raws.values() if raw.category}
+        for category in await self._select_in(
+            session, Category.slug, wanted - category_ids.keys()
+        ):
+            category_ids[category.slug] = category.id
+        new_categories: dict[str, Category] = {}
+
+        # ---- create missing Products (and Categories) in one flush ----
+        product_for_sku: dict[str, Product] = {}
+        for sku, raw in new_raws.items():
+            product = products_by_ean.get(raw.ean) if raw.ean else None
+            if product is None:
+                product = Product(
+                    name=raw.name,
+                    brand=raw.brand,
+                    ean=raw.ean,
+                    unit=raw.unit,
+                    unit_size=raw.unit_size,
+                    image_url=raw.image_url,
+                )
+                if raw.category:
+                    slug = _category_slug(raw.category)
+                    if slug in category_ids:
+                        product.category_id = category_ids[slug]
+                    else:
+                        if slug not in new_categories:
+                            new_categories[slug] = Category(name=raw.category, slug=slug)
+                        product.category = new_categories[slug]
+                if raw.ean:
+                    products_by_ean[raw.ean] = product
+                session.add(product)
+            product_for_sku[sku] = product
+        if product_for_sku:
+            await session.flush()
+        created_category_ids = {slug: category.id for slug, category in new_categories.items()}
+        for sku, product in product_for_sku.items():
+            listings[sku]["product_id"] = product.id
+
+        # ---- upsert StoreProducts; existing rows only get new metadata ----
+        stmt = pg_insert(StoreProduct)
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[StoreProduct.store_id, StoreProduct.store_sku],
+            set_={
+                "store_name": stmt.excluded.store_name,
+                "store_url": func.coalesce(stmt.excluded.store_url, StoreProduct.store_url),
+                "is_active": True,
+            },
+        ).returning(StoreProduct.store_sku, StoreProduct.id)
+        store_product_ids: dict[str, int] = {}
+        if listings:
+            result = await session.execute(stmt, list(listings.values()))
+            store_product_ids = dict(result.all())
+
+        # ---- always create a price record ----
+        price_rows = [
+            {
+                "store_product_id": store_product_ids[raw.store_sku],
+                "price": raw.price,
+                "promo_price": raw.promo_price,
+                "promo_label": raw.promo_label,
+                "unit_price": raw.unit_price,
+                "in_stock": raw.in_stock,
+            }
+            for raw in products
+        ]
+        copied = False
+        if len(price_rows) >= COPY_THRESHOLD:
+            copied = await self._copy_price_records(session, price_rows)
+        if not copied:
+            for start in range(0, len(price_rows), BULK_CHUNK):
+                await session.execute(
+                    insert(PriceRecord), price_rows[start : start + BULK_CHUNK]
                 )
 
         await session.commit()
-        logger.info("[%s] Saved %d / %d products", self.store_slug, saved, len(products))
+        # Only committed categories are cached: a failed save rolls its new
+        # ones back, and later chunks must not point products at them
+        category_ids.update(created_category_ids)
+        logger.info("[%s] Saved %d / %d products", self.store_slug, len(price_rows), scraped)
+
+    @staticmethod
+    async def _copy_price_records(session: AsyncSession, rows: list[dict]) -> bool:
+        """Append *rows* to ``price_records`` with ``COPY`` on the session's connection.
+
+        Runs inside the session's transaction.  Returns ``False`` without
+        writing anything when the driver is not asyncpg.
+        """
+        connection = await session.connection()
+        if connection.dialect.driver != "asyncpg":
+            return False
+        raw = await connection.get_raw_connection()
+        await raw.driver_connection.copy_records_to_table(
+            PriceRecord.__tablename__,
+            records=[tuple(row[column] for column in PRICE_RECORD_COLUMNS) for row in rows],
+            columns=PRICE_RECORD_COLUMNS,
+        )
+        return True
+
+    @staticmethod
+    async def _select_in(
+        session: AsyncSession,
+        column: InstrumentedAttribute,
+        values: set,
+        *criteria,
+        columns: tuple[InstrumentedAttribute, ...] = (),
+    ) -> list:
+        """Return the rows of *column*'s entity whose *column* is in *values*.
+
+        With *columns*, only those are selected and plain row tuples are
+        returned instead of entities.  Queries in chunks to stay well under
+        asyncpg's bind-parameter limit.
+        """
+        values = list(values)
+        rows = []
+        for start in range(0, len(values), IN_CLAUSE_CHUNK):
+            stmt = select(*columns) if columns else select(column.class_)
+            stmt = stmt.where(column.in_(values[start : start + IN_CLAUSE_CHUNK]), *criteria)
+            result = await session.execute(stmt)
+            rows.extend(result.tuples() if columns else result.scalars())
+        return rows
 
     # ------------------------------------------------------------------
     # Utility helpers
@@ -325,17 +657,136 @@ class BaseScraper(ABC):
         return result.scalar_one_or_none()
 
     @staticmethod
+    async def _launch_browser(headless: bool = True) -> tuple[Playwright, Browser]:
+        """Start Playwright with stealth patches and launch Chromium."""
+        pw = await async_playwright().start()
+
+        # Apply stealth patches to bypass bot detection (Akamai, etc.)
+        stealth = Stealth(navigator_platform_override="MacIntel")
+        stealth.hook_playwright_context(pw)
+
+        browser = await pw.chromium.launch(
+            headless=headless,
+            args=[
+                "--disable-blink-features=AutomationControlled",
+                # /dev/shm is small in containers; several contexts share this
+                # browser for the whole run, so spill to /tmp instead of crashing
+                "--disable-dev-shm-usage",
+                "--disable-gpu",
+            ],
+        )
+        return pw, browser
+
+    @staticmethod
+    async def _configure_context(
+        browser: Browser,
+        block_resources: bool = True,
+        block_stylesheets: bool = False,
+        block_service_workers: bool = False,
+        **extra_context_kwargs,
+    ) -> BrowserContext:
+        """Open a new context on *browser* with our fingerprint and blocking."""
+        if block_service_workers:
+            # Service workers would fetch past the route() blocking below
+            extra_context_kwargs["service_workers"] = "block"
+        context = await browser.new_context(
+            user_agent=random_user_agent(),
+            viewport={"width": 1366, "height": 768},
+            locale="en-IE",
+            timezone_id="Europe/Dublin",
+            **extra_context_kwargs,
+        )
+        if block_resources:
+            blocked_types = BLOCKED_RESOURCE_TYPES
+            if block_stylesheets:
+                blocked_types = blocked_types | {"stylesheet"}
+
+            async def _block(route: Route) -> None:
+                request = route.request
+                if request.resource_type in blocked_types or any(
+                    fragment in request.url for fragment in BLOCKED_URL_FRAGMENTS
+                ):
+                    await route.abort()
+                else:
+                    await route.continue_()
+
+            await context.route("**/*", _block)
+        return context
+
+    async def _ensure_browser(self) -> Browser:
+        """Return the scraper's shared browser, launching it on first use.
+
+        Concurrent categories share the one Chromium process; it stays up
+        until :meth:`aclose`.  If :func:`start_shared_browser` has already
+        launched one for the process, that one is borrowed instead.
+        """
+        if self._browser_lock is None:
+            self._browser_lock = asyncio.Lock()
+        async with self._browser_lock:
+            if self._browser is None:
+                if _shared_browser is not None and _shared_browser[1].is_connected():
+                    self._browser = _shared_browser[1]
+                else:
+                    self._pw, self._browser = await self._launch_browser(headless=True)
+        return self._browser
+
+    async def _new_context(self, **context_kwargs) -> BrowserContext:
+        """Open an isolated context on the shared browser.
+
+        Accepts the same options as :meth:`_configure_context`.  The caller
+        closes the context; the browser is closed by :meth:`aclose`.
+        """
+        browser = await self._ensure_browser()
+        return await self._configure_context(browser, **context_kwargs)
+
+    async def _open_context(self) -> BrowserContext:
+        """Open a context for :meth:`_pooled_page`; override to add routes."""
+        return await self._new_context()
+
+    @asynccontextmanager
+    async def _pooled_page(self) -> AsyncIterator[Page]:
+        """Yield a fresh page on a reused browser context.
+
+        Contexts are checked out of an idle pool and returned once the page
+        is closed, so cookies, consent state and routes survive from one
+        category to the next.  :meth:`scrape_all` bounds how many are in
+        use, so no more than ``max_concurrency`` contexts are ever opened.
+        The contexts are closed together with the browser in :meth:`aclose`.
+        """
+        if self._context_pool is None:
+            self._context_pool = asyncio.Queue()
+        pool = self._context_pool
+        try:
+            context = pool.get_nowait()
+        except asyncio.QueueEmpty:
+            context = await self._open_context()
+        page = await context.new_page()
+        try:
+            yield page
+        finally:
+            await page.close()
+            pool.put_nowait(context)
+
+    @classmethod
     async def _get_browser_context(
+        cls,
         headless: bool = True,
         block_resources: bool = True,
+        block_stylesheets: bool = False,
+        block_service_workers: bool = False,
         **extra_context_kwargs,
     ) -> tuple:
         """Create and return ``(playwright, browser, context)``.
 
         Args:
             headless: Run in headless mode.
-            block_resources: Block images/fonts to speed up scraping.
-                Disable for sites with strict WAF (e.g. Tesco/Akamai).
+            block_resources: Block images/media/fonts and analytics to speed
+                up scraping.  Disable for sites with strict WAF (e.g. Tesco/Akamai).
+            block_stylesheets: Also block CSS.  Only for sites whose scraping
+                does not depend on layout or visibility.
+            block_service_workers: Refuse service-worker registration, so no
+                request bypasses the resource blocking.  Leave off for sites
+                with strict WAF, like *block_resources*.
 
         Caller is responsible for closing them via::
 
@@ -343,26 +794,12 @@ class BaseScraper(ABC):
             await browser.close()
             await pw.stop()
         """
-        pw = await async_playwright().start()
-
-        # Apply stealth patches to bypass bot detection (Akamai, etc.)
-        stealth = Stealth(navigator_platform_override="MacIntel")
-        stealth.hook_playwright_context(pw)
-
-        browser = await pw.chromium.launch(
-            headless=headless,
-            args=["--disable-blink-features=AutomationControlled"],
-        )
-        context = await browser.new_context(
-            user_agent=random_user_agent(),
-            viewport={"width": 1366, "height": 768},
-            locale="en-IE",
-            timezone_id="Europe/Dublin",
+        pw, browser = await cls._launch_browser(headless=headless)
+        context = await cls._configure_context(
+            browser,
+            block_resources=block_resources,
+            block_stylesheets=block_stylesheets,
+            block_service_workers=block_service_workers,
             **extra_context_kwargs,
         )
-        if block_resources:
-            await context.route(
-                "**/*.{png,jpg,jpeg,gif,svg,woff,woff2,ttf,eot}",
-                lambda route: route.abort(),
-            )
         return pw, browser, context
@@ -1,8 +1,9 @@
 """Scraper for Dunnes Stores Grocery (dunnesstoresgrocery.com).
 
 Dunnes has a JavaScript-heavy storefront with anti-bot protections.
-We use Playwright exclusively, with user-agent rotation, random delays,
-and careful DOM extraction.
+Each category is first fetched with httpx in case the served HTML already
+embeds its products as JSON; otherwise Playwright renders it, with
+user-agent rotation, random delays, and careful DOM extraction.
 
 IMPORTANT: The grocery site is at www.dunnesstoresgrocery.com (NOT dunnesstores.com).
 Category URLs use the format /categories/{slug}-id-{numeric_id}.
@@ -13,14 +14,25 @@ from __future__ import annotations
 import asyncio
 import logging
 import re
+from collections import deque
 from decimal import Decimal, InvalidOperation
+from functools import lru_cache
+from urllib.parse import urljoin
 
-from playwright.async_api import Page
+import httpx
+import orjson
+from lxml import etree
+from lxml import html as lxml_html
+from lxml.html import HtmlElement
+from playwright.async_api import BrowserContext, Page
 
 from src.scrapers.base import (
+    DEFAULT_HEADERS,
     BaseScraper,
     RawProduct,
     random_delay,
+    random_user_agent,
+    stable_hash,
 )
 
 logger = logging.getLogger(__name__)
@@ -37,8 +49,221 @@ CATEGORY_PATHS = [
 ]
 
 
+# Regexes used per tile
+_RE_SKU_P = re.compile(r"/p/(\d+)")
+_RE_SKU_ID = re.compile(r"-id-(\d+)")
+_RE_SKU_TRAILING = re.compile(r"/(\d+)(?:\?|$)")
+_RE_WAS_PRICE = re.compile(r"(\d+[.,]\d{2})")
+_RE_UNIT_PRICE = re.compile(r"([\d.]+)\s*/\s*(\w+)")
+_RE_PRICE_JUNK = re.compile(r"[^\d.,]")
+
+# Own-brand products are prefixed "Dunnes Stores"; compared on a slice so
+# only the prefix gets case-folded, not the whole name
+_OWN_BRAND = "Dunnes Stores"
+_OWN_BRAND_KEY = _OWN_BRAND.casefold()
+
+# Product tile selectors; the fallback casts a wider net when dunnesstoresgrocery.com
+# uses class names none of the primary patterns match
+_TILE_SELECTOR = (
+    "div[data-ref='productListItem'], "
+    "div[class*='ProductCard'], "
+    "li[class*='ProductCard'], "
+    "article[class*='product-card'], "
+    "div[class*='product-list-item'], "
+    "div[class*='product-tile'], "
+    "div[class*='productTile'], "
+    "a[class*='product-card'], "
+    "div[data-product-id]"
+)
+_TILE_SELECTOR_FALLBACK = (
+    "[class*='product'] a[href*='/'], "
+    "[class*='card'][class*='product'], "
+    "[class*='item'][data-product-id]"
+)
+_NAME_SELECTOR = (
+    "a[class*='ProductCard__title'], "
+    "a[class*='product-card__title'], "
+    "a[data-ref='productCardTitle'], "
+    "p[class*='ProductCard__title'], "
+    "h3 a, h2 a, h3, h2, "
+    "a[class*='Title'], "
+    "span[class*='title'], "
+    "p[class*='title']"
+)
+_PRICE_SELECTOR = (
+    "span[class*='Price__current'], "
+    "span[class*='ProductCard__price'], "
+    "span[data-ref='productCardPrice'], "
+    "span[class*='price-value'], "
+    "span[class*='price'], "
+    "span.price, "
+    "div[class*='price']"
+)
+_PROMO_SELECTOR = (
+    "span[class*='Price__was'], "
+    "span[class*='price-was'], "
+    "span[class*='offer'], "
+    "div[class*='PromoBadge'], "
+    "span[data-ref='productCardPromo'], "
+    "del, s, "
+    "span[class*='was']"
+)
+_UNIT_PRICE_SELECTOR = (
+    "span[class*='UnitPrice'], "
+    "span[class*='unit-price'], "
+    "span[data-ref='productCardUnitPrice'], "
+    "span[class*='per-unit']"
+)
+# Top-level category links in the navigation: /categories/{slug}-id-{id}.
+# Deep subcategories (/categories/{parent}/{child}-id-{id}) are skipped.
+_CATEGORY_LINKS_JS = '''() => {
+    return [...document.querySelectorAll('a[href*="/categories/"]')]
+        .map(a => a.href)
+        .filter(href => {
+            try {
+                const path = new URL(href).pathname;
+                const parts = path.split('/').filter(Boolean);
+                return parts.length === 2
+                    && parts[0] === 'categories'
+                    && parts[1].includes('-id-');
+            } catch(e) { return false; }
+        });
+}'''
+
+# Every embedded state blob as [source, JSON text], in the order they are
+# tried; see _extract_from_js_state()
+_EMBEDDED_STATE_JS = '''() => {
+    const found = [];
+    // Attempt 1: __NEXT_DATA__ (Next.js) or a Redux-style initial state
+    const next = document.getElementById('__NEXT_DATA__');
+    if (next && next.textContent) {
+        found.push(['next', next.textContent]);
+    }
+    if (window.__INITIAL_STATE__) {
+        try {
+            found.push(['state', JSON.stringify(window.__INITIAL_STATE__)]);
+        } catch (e) {}
+    }
+    // Attempt 2: dataLayer product impressions
+    if (window.dataLayer) {
+        for (const entry of window.dataLayer) {
+            if (entry.ecommerce && entry.ecommerce.impressions) {
+                found.push(['dl', JSON.stringify(entry.ecommerce.impressions)]);
+            }
+        }
+    }
+    // Attempt 3: look for JSON-LD structured data
+    const scripts = document.querySelectorAll('script[type="application/ld+json"]');
+    for (const s of scripts) {
+        if (s.textContent.includes('ItemList')) {
+            found.push(['ld', s.textContent]);
+        }
+    }
+    return found;
+}'''
+
+# Lazy-load scroller; see _scroll_page()
+_SCROLL_JS = '''async ([tileSel, maxScrolls]) => {
+    const size = () =>
+        document.querySelectorAll(tileSel).length + ':' + document.body.scrollHeight;
+    let last = size();
+    let unchanged = 0;
+    for (let i = 0; i < maxScrolls; i++) {
+        window.scrollBy(0, window.innerHeight);
+        await new Promise(resolve => setTimeout(resolve, 300));
+        const now = size();
+        unchanged = now === last ? unchanged + 1 : 0;
+        if (unchanged >= 2) break;
+        last = now;
+    }
+}'''
+
+_OVERLAY_SELECTORS = (
+    "button:has-text('Accept All')",
+    "button:has-text('Accept Cookies')",
+    "button:has-text('Accept')",
+    "button[id*='cookie'] >> text=Accept",
+    "button[class*='cookie'] >> text=Accept",
+    "button[aria-label='Close']",
+)
+# Cap on next-page links followed over HTTP for one category
+_MAX_HTTPX_PAGES = 50
+
+_LOAD_MORE_SELECTORS = (
+    "button:has-text('Load More')",
+    "button:has-text('Show More')",
+    "a:has-text('Load More')",
+    "button[data-ref='loadMore']",
+    "a[class*='pagination__next']",
+    "a[rel='next']",
+)
+
+# DOM tile extractor, installed on every pooled context by _open_context() so
+# each "Load More" pass only evaluates a short call instead of the source
+_EXTRACT_TILES_JS = """(() => {
+    const [tileSelectors, nameSel, priceSel, promoSel, unitSel] = %s;
+    window.__extractDunnes = () => {
+        let tiles = [];
+        for (const sel of tileSelectors) {
+            tiles = document.querySelectorAll(sel);
+            if (tiles.length > 0) break;
+        }
+        const text = (tile, sel) => {
+            const el = tile.querySelector(sel);
+            return el ? el.innerText : '';
+        };
+        return [...tiles].map(tile => {
+            const nameEl = tile.querySelector(nameSel);
+            let name = nameEl ? nameEl.innerText.trim() : '';
+            let href = nameEl ? (nameEl.getAttribute('href') || '') : '';
+            if (!name) {
+                // Try alternative: any <a> with inner text
+                const a = tile.querySelector('a');
+                if (a) {
+                    name = a.innerText.trim();
+                    href = a.getAttribute('href') || '';
+                }
+            }
+            const img = tile.querySelector('img');
+            return {
+                name: name,
+                href: href,
+                sku: tile.getAttribute('data-product-id')
+                    || tile.getAttribute('data-sku')
+                    || tile.getAttribute('data-ref')
+                    || '',
+                price: text(tile, priceSel),
+                promo: text(tile, promoSel),
+                image: img ? (img.getAttribute('src') || img.getAttribute('data-src')) : null,
+                unit: text(tile, unitSel),
+            };
+        });
+    };
+})();
+""" % orjson.dumps(
+    [
+        [_TILE_SELECTOR, _TILE_SELECTOR_FALLBACK],
+        _NAME_SELECTOR,
+        _PRICE_SELECTOR,
+        _PROMO_SELECTOR,
+        _UNIT_PRICE_SELECTOR,
+    ]
+).decode()
+
+
 class DunnesScraper(BaseScraper):
     store_slug = "dunnes"
+    # Categories render in pooled contexts on the one shared browser
+    max_concurrency = 4
+    delay_enabled = False
+
+    def __init__(self) -> None:
+        self._client: httpx.AsyncClient | None = None
+        # Selectors that last matched; see _dismiss_overlays() / _click_load_more()
+        self._overlay_selector: str | None = None
+        self._load_more_selector: str | None = None
+        # Whether rendered pages embed product JSON; None until a page shows it
+        self._js_state_works: bool | None = None
 
     # ------------------------------------------------------------------
     # Category URLs
@@ -58,102 +283,174 @@ class DunnesScraper(BaseScraper):
 
     async def _discover_categories(self) -> list[str]:
         """Discover category URLs from the site navigation."""
-        pw, browser, context = await self._get_browser_context(headless=True)
         try:
-            page = await context.new_page()
-            logger.info("[dunnes] Discovering categories from %s", BASE_URL)
-            await page.goto(BASE_URL, wait_until="domcontentloaded", timeout=60_000)
-            await asyncio.sleep(3)
-            await self._dismiss_overlays(page)
+            async with self._pooled_page() as page:
+                logger.info("[dunnes] Discovering categories from %s", BASE_URL)
+                await page.goto(BASE_URL, wait_until="domcontentloaded", timeout=60_000)
+                await self._wait_for(page, "a[href*='/categories/']")
+                await self._dismiss_overlays(page)
+
+                links = await page.evaluate(_CATEGORY_LINKS_JS)
+                # Keep navigation order so categories are scraped deterministically
+                unique = list(dict.fromkeys(links))
+
+                # If homepage didn't yield enough, also try interacting with nav menus
+                if len(unique) < 5:
+                    logger.debug("[dunnes] Few links found, attempting to expand nav menus")
+                    nav_triggers = page.locator(
+                        "button[class*='nav'], "
+                        "a[class*='nav'], "
+                        "button[aria-expanded='false'], "
+                        "li[class*='menu'] > a"
+                    )
+                    trigger_count = await nav_triggers.count()
+                    for idx in range(min(trigger_count, 10)):
+                        try:
+                            trigger = nav_triggers.nth(idx)
+                            if await trigger.is_visible():
+                                await trigger.click()
+                                await asyncio.sleep(0.5)
+                        except Exception:
+                            pass
 
-            links = await page.evaluate('''() => {
-                return [...document.querySelectorAll('a[href*="/categories/"]')]
-                    .map(a => a.href)
-                    .filter(href => {
-                        // Only keep top-level categories: /categories/{slug}-id-{id}
-                        // Skip deep subcategories: /categories/{parent}/{child}-id-{id}
-                        try {
-                            const path = new URL(href).pathname;
-                            const parts = path.split('/').filter(Boolean);
-                            return parts.length === 2
-                                && parts[0] === 'categories'
-                                && parts[1].includes('-id-');
-                        } catch(e) { return false; }
-                    });
-            }''')
-            unique = list(set(links))
-
-            # If homepage didn't yield enough, also try interacting with nav menus
-            if len(unique) < 5:
-                logger.debug("[dunnes] Few links found, attempting to expand nav menus")
-                nav_triggers = page.locator(
-                    "button[class*='nav'], "
-                    "a[class*='nav'], "
-                    "button[aria-expanded='false'], "
-                    "li[class*='menu'] > a"
-                )
-                trigger_count = await nav_triggers.count()
-                for idx in range(min(trigger_count, 10)):
-                    try:
-                        trigger = nav_triggers.nth(idx)
-                        if await trigger.is_visible():
-                            await trigger.click()
-                            await asyncio.sleep(0.5)
-                    except Exception:
-                        pass
-
-                more_links = await page.evaluate('''() => {
-                    return [...document.querySelectorAll('a[href*="/categories/"]')]
-                        .map(a => a.href)
-                        .filter(href => {
-                            try {
-                                const path = new URL(href).pathname;
-                                const parts = path.split('/').filter(Boolean);
-                                return parts.length === 2
-                                    && parts[0] === 'categories'
-                                    && parts[1].includes('-id-');
-                            } catch(e) { return false; }
-                        });
-                }''')
-                unique = list(set(unique + more_links))
-
-            return unique
+                    more_links = await page.evaluate(_CATEGORY_LINKS_JS)
+                    unique = list(dict.fromkeys([*unique, *more_links]))
+
+                return unique
 
         except Exception:
             logger.warning("[dunnes] Category discovery failed", exc_info=True)
             return []
-        finally:
-            await context.close()
-            await browser.close()
-            await pw.stop()
 
     # ------------------------------------------------------------------
     # Scrape one category page (with pagination)
     # ------------------------------------------------------------------
     async def scrape_category(self, category_url: str) -> list[RawProduct]:
+        # Try plain HTTP first; the page may already carry its products as JSON
+        try:
+            products = await self._scrape_with_httpx(category_url)
+        except Exception as exc:
+            logger.info("[dunnes] httpx fetch failed for %s (%s)", category_url, exc)
+            products = []
+        if products:
+            return products
+
+        return await self._scrape_with_playwright(category_url)
+
+    # ------------------------------------------------------------------
+    # httpx-based scraping (fast path, no browser)
+    # ------------------------------------------------------------------
+    async def _scrape_with_httpx(self, category_url: str) -> list[RawProduct]:
+        """Fetch the category over HTTP and parse it with lxml.
+
+        Embedded product JSON is preferred; otherwise product tiles in the
+        served HTML are read.  Next-page links are followed over HTTP.
+        Returns an empty list when a page has no products (the storefront
+        rendered client-side) or only a script-driven "Load More" button,
+        so the caller falls back to Playwright for the whole category.
+        """
+        client = self._get_client()
+        headers = {"User-Agent": random_user_agent()}
         products: list[RawProduct] = []
+        seen_skus: set[str] = set()
+        url = category_url
+
+        for page_num in range(1, _MAX_HTTPX_PAGES + 1):
+            logger.info("[dunnes] Fetching %s", url)
+            response = await client.get(url, headers=headers)
+            response.raise_for_status()
+
+            if not response.content:
+                break
+            # Decoded by httpx from the Content-Type charset
+            doc = lxml_html.fromstring(response.text)
+
+            if _XPATH_LOAD_MORE_BUTTON(doc):
+                # The rest of the listing only arrives through the button
+                logger.info("[dunnes] httpx: %s pages with Load More; needs a browser", url)
+                return []
 
-        pw, browser, context = await self._get_browser_context(headless=True)
-        try:
-            page = await context.new_page()
+            found = _embedded_product_list(doc)
+            if found:
+                source, items = found
+                batch = self._parse_js_items(items)
+            else:
+                # Server-rendered tiles, read with the same selectors as the browser
+                source = "HTML tiles"
+                batch = self._parse_tile_rows(_tile_rows(doc))
+
+            new = [p for p in batch if p.store_sku not in seen_skus]
+            seen_skus.update(p.store_sku for p in new)
+            products.extend(new)
+            logger.info(
+                "[dunnes] httpx page %d: %d products from %s, %d new (total %d)",
+                page_num,
+                len(batch),
+                source,
+                len(new),
+                len(products),
+            )
+            if not new:
+                break
+
+            next_hrefs = _XPATH_NEXT_HREF(doc)
+            if not next_hrefs:
+                break
+            url = urljoin(str(response.url), next_hrefs[0])
+
+        return products
+
+    async def _open_context(self) -> BrowserContext:
+        """Open a pooled context with the DOM tile extractor pre-installed."""
+        context = await self._new_context(block_service_workers=True)
+        await context.add_init_script(_EXTRACT_TILES_JS)
+        return context
+
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared httpx client, creating it on first use.
+
+        One client is kept for the whole run so every category reuses the
+        same keep-alive (HTTP/2) connections.
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                headers=DEFAULT_HEADERS,
+                http2=True,
+                follow_redirects=True,
+                timeout=30.0,
+                limits=httpx.Limits(max_connections=10, max_keepalive_connections=10),
+            )
+        return self._client
 
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        await super().aclose()
+
+    # ------------------------------------------------------------------
+    # Playwright-based scraping (fallback)
+    # ------------------------------------------------------------------
+    async def _scrape_with_playwright(self, category_url: str) -> list[RawProduct]:
+        products: list[RawProduct] = []
+
+        async with self._pooled_page() as page:
             logger.info("[dunnes] Loading %s", category_url)
             await page.goto(category_url, wait_until="domcontentloaded", timeout=60_000)
-            await asyncio.sleep(3)
+            await self._wait_for(page, _TILE_SELECTOR)
 
             # Dismiss cookie / overlay banners
             await self._dismiss_overlays(page)
 
             # Keep loading more products until there is no "Load More" button
             page_num = 0
+            seen_skus: set[str] = set()
             while True:
                 page_num += 1
                 await self._scroll_page(page)
-                await asyncio.sleep(1)
 
                 batch = await self._extract_products(page, category_url)
                 new_count = 0
-                seen_skus = {p.store_sku for p in products}
                 for p in batch:
                     if p.store_sku not in seen_skus:
                         products.append(p)
@@ -168,6 +465,10 @@ class DunnesScraper(BaseScraper):
                     len(products),
                 )
 
+                # A click that added nothing would just repeat forever
+                if page_num > 1 and new_count == 0:
+                    break
+
                 # Try clicking "Load More" or next-page button
                 loaded_more = await self._click_load_more(page)
                 if not loaded_more:
@@ -175,11 +476,6 @@ class DunnesScraper(BaseScraper):
 
                 await random_delay(1.5, 3.0)
 
-        finally:
-            await context.close()
-            await browser.close()
-            await pw.stop()
-
         return products
 
     # ------------------------------------------------------------------
@@ -194,158 +490,82 @@ class DunnesScraper(BaseScraper):
         2. Fall back to broad CSS-selector scraping of product tiles.
         """
         # --- Pass 1: try to pull data from JS state ---
-        js_products = await self._extract_from_js_state(page, category_url)
-        if js_products:
-            logger.info("[dunnes] Extracted %d products from JS state", len(js_products))
-            return js_products
+        # Skipped once a page has shown the site does not embed products
+        if self._js_state_works is not False:
+            js_products = await self._extract_from_js_state(page, category_url)
+            if js_products:
+                self._js_state_works = True
+                logger.info("[dunnes] Extracted %d products from JS state", len(js_products))
+                return js_products
 
         # --- Pass 2: DOM selector scraping ---
-        products: list[RawProduct] = []
-
-        # dunnesstoresgrocery.com may use different class names;
-        # cast a wide net with multiple selector patterns
-        tiles = page.locator(
-            "div[data-ref='productListItem'], "
-            "div[class*='ProductCard'], "
-            "li[class*='ProductCard'], "
-            "article[class*='product-card'], "
-            "div[class*='product-list-item'], "
-            "div[class*='product-tile'], "
-            "div[class*='productTile'], "
-            "a[class*='product-card'], "
-            "div[data-product-id]"
-        )
-        count = await tiles.count()
-
-        if count == 0:
-            # Broader fallback: look for any repeated card-like structure
-            logger.debug("[dunnes] Primary selectors found 0 tiles; trying broader selectors")
-            tiles = page.locator(
-                "[class*='product'] a[href*='/'], "
-                "[class*='card'][class*='product'], "
-                "[class*='item'][data-product-id]"
-            )
-            count = await tiles.count()
+        # Read every tile in one round-trip instead of several per tile
+        rows = await page.evaluate("() => window.__extractDunnes && window.__extractDunnes()")
+        if rows is None:
+            # Context opened without the init script (or the page replaced it)
+            await page.evaluate(_EXTRACT_TILES_JS)
+            rows = await page.evaluate("() => window.__extractDunnes()")
+
+        products = self._parse_tile_rows(rows)
+        if products and self._js_state_works is None:
+            # Tiles rendered without embedded JSON: stop probing for it
+            self._js_state_works = False
+        return products
 
-        for i in range(count):
+    def _parse_tile_rows(self, rows: list[dict]) -> list[RawProduct]:
+        """Build RawProducts from per-tile text rows (browser or lxml)."""
+        products: list[RawProduct] = []
+        for i, row in enumerate(rows):
             try:
-                tile = tiles.nth(i)
-
-                # --- Name + link ---
-                name_el = tile.locator(
-                    "a[class*='ProductCard__title'], "
-                    "a[class*='product-card__title'], "
-                    "a[data-ref='productCardTitle'], "
-                    "p[class*='ProductCard__title'], "
-                    "h3 a, h2 a, h3, h2, "
-                    "a[class*='Title'], "
-                    "span[class*='title'], "
-                    "p[class*='title']"
-                )
-                name = ""
-                href = ""
-                if await name_el.count() > 0:
-                    name = (await name_el.first.inner_text()).strip()
-                    href = await name_el.first.get_attribute("href") or ""
-
-                if not name:
-                    # Try alternative: any <a> with inner text
-                    fallback_a = tile.locator("a")
-                    if await fallback_a.count() > 0:
-                        name = (await fallback_a.first.inner_text()).strip()
-                        href = await fallback_a.first.get_attribute("href") or ""
-
+                name = row.get("name") or ""
+                href = row.get("href") or ""
                 if not name:
                     continue
 
                 # --- SKU ---
-                sku = ""
-                data_id = await tile.get_attribute("data-product-id") or ""
-                data_sku = await tile.get_attribute("data-sku") or ""
-                data_ref = await tile.get_attribute("data-ref") or ""
-                sku = data_id or data_sku or data_ref
+                sku = row.get("sku") or ""
                 if not sku and href:
                     sku_match = (
-                        re.search(r"/p/(\d+)", href)
-                        or re.search(r"-id-(\d+)", href)
-                        or re.search(r"/(\d+)(?:\?|$)", href)
+                        _RE_SKU_P.search(href)
+                        or _RE_SKU_ID.search(href)
+                        or _RE_SKU_TRAILING.search(href)
                     )
                     sku = sku_match.group(1) if sku_match else ""
                 if not sku:
-                    sku = f"dunnes-{hash(name) % 1000000}"
+                    sku = f"dunnes-{stable_hash(name)}"
 
                 # --- Price ---
-                price_el = tile.locator(
-                    "span[class*='Price__current'], "
-                    "span[class*='ProductCard__price'], "
-                    "span[data-ref='productCardPrice'], "
-                    "span[class*='price-value'], "
-                    "span[class*='price'], "
-                    "span.price, "
-                    "div[class*='price']"
-                )
-                price_text = ""
-                if await price_el.count() > 0:
-                    price_text = await price_el.first.inner_text()
-
-                price = self._parse_price(price_text)
+                price = _parse_price(row.get("price") or "")
                 if price is None or price == 0:
                     continue
 
                 # --- Promo / was price ---
                 promo_price = None
-                promo_label = None
-                promo_el = tile.locator(
-                    "span[class*='Price__was'], "
-                    "span[class*='price-was'], "
-                    "span[class*='offer'], "
-                    "div[class*='PromoBadge'], "
-                    "span[data-ref='productCardPromo'], "
-                    "del, s, "
-                    "span[class*='was']"
-                )
-                if await promo_el.count() > 0:
-                    promo_label = (await promo_el.first.inner_text()).strip() or None
+                promo_label = (row.get("promo") or "").strip() or None
+                if promo_label:
                     # If there is a was-price, the current price is the promo price
-                    was_text = promo_label or ""
-                    was_match = re.search(r"(\d+[.,]\d{2})", was_text)
+                    was_match = _RE_WAS_PRICE.search(promo_label)
                     if was_match:
-                        original = self._parse_price(was_match.group(1))
+                        original = _parse_price(was_match.group(1))
                         if original and original > price:
                             promo_price = price
                             price = original
 
                 # --- Image ---
-                image_url = None
-                img_el = tile.locator("img")
-                if await img_el.count() > 0:
-                    image_url = (
-                        await img_el.first.get_attribute("src")
-                        or await img_el.first.get_attribute("data-src")
-                    )
-                    if image_url and image_url.startswith("//"):
-                        image_url = f"https:{image_url}"
-                    elif image_url and image_url.startswith("/"):
-                        image_url = f"{BASE_URL}{image_url}"
+                image_url = row.get("image")
+                if image_url and image_url.startswith("//"):
+                    image_url = f"https:{image_url}"
+                elif image_url and image_url.startswith("/"):
+                    image_url = f"{BASE_URL}{image_url}"
 
                 # --- Unit price ---
                 unit_price = None
                 unit = None
-                unit_el = tile.locator(
-                    "span[class*='UnitPrice'], "
-                    "span[class*='unit-price'], "
-                    "span[data-ref='productCardUnitPrice'], "
-                    "span[class*='per-unit']"
-                )
-                if await unit_el.count() > 0:
-                    unit_text = await unit_el.first.inner_text()
-                    up_match = re.search(r"([\d.]+)\s*/\s*(\w+)", unit_text)
-                    if up_match:
-                        try:
-                            unit_price = Decimal(up_match.group(1))
-                            unit = up_match.group(2).lower()
-                        except (InvalidOperation, ValueError):
-                            pass
+                up_match = _RE_UNIT_PRICE.search(row.get("unit") or "")
+                if up_match:
+                    unit_price = _parse_price(up_match.group(1))
+                    if unit_price is not None:
+                        unit = up_match.group(2).lower()
 
                 product_url = href
                 if product_url and not product_url.startswith("http"):
@@ -354,8 +574,8 @@ class DunnesScraper(BaseScraper):
                 # --- Brand (from name heuristic: first word(s) before product type) ---
                 brand = None
                 # Dunnes own-brand appears as "Dunnes Stores" in the name
-                if name.lower().startswith("dunnes stores"):
-                    brand = "Dunnes Stores"
+                if name[: len(_OWN_BRAND_KEY)].casefold() == _OWN_BRAND_KEY:
+                    brand = _OWN_BRAND
 
                 products.append(
                     RawProduct(
@@ -384,178 +604,345 @@ class DunnesScraper(BaseScraper):
 
         Many modern grocery sites embed product data in __NEXT_DATA__,
         dataLayer, or similar global JS objects. This is more reliable
-        than scraping CSS selectors when it works.
+        than scraping CSS selectors when it works.  Every candidate blob
+        comes back as raw JSON text and is parsed with orjson in turn until
+        one holds products; the product list is found by its keys rather
+        than a fixed path.
         """
         try:
-            js_data = await page.evaluate('''() => {
-                // Attempt 1: __NEXT_DATA__ (Next.js)
-                if (window.__NEXT_DATA__) {
-                    try {
-                        const props = window.__NEXT_DATA__.props;
-                        if (props && props.pageProps && props.pageProps.products) {
-                            return { source: 'next', items: props.pageProps.products };
-                        }
-                        if (props && props.pageProps && props.pageProps.category
-                            && props.pageProps.category.products) {
-                            return { source: 'next', items: props.pageProps.category.products };
-                        }
-                        // Recurse one level into pageProps looking for product arrays
-                        if (props && props.pageProps) {
-                            for (const [key, val] of Object.entries(props.pageProps)) {
-                                if (Array.isArray(val) && val.length > 0 && val[0].name) {
-                                    return { source: 'next', items: val };
-                                }
-                            }
-                        }
-                    } catch (e) {}
-                }
-                // Attempt 2: dataLayer product impressions
-                if (window.dataLayer) {
-                    for (const entry of window.dataLayer) {
-                        if (entry.ecommerce && entry.ecommerce.impressions) {
-                            return { source: 'dl', items: entry.ecommerce.impressions };
-                        }
-                    }
-                }
-                // Attempt 3: look for JSON-LD structured data
-                const scripts = document.querySelectorAll('script[type="application/ld+json"]');
-                for (const s of scripts) {
-                    try {
-                        const d = JSON.parse(s.textContent);
-                        if (d['@type'] === 'ItemList' && d.itemListElement) {
-                            return { source: 'ld', items: d.itemListElement };
-                        }
-                    } catch (e) {}
-                }
-                return null;
-            }''')
+            candidates = await page.evaluate(_EMBEDDED_STATE_JS)
+        except Exception:
+            logger.debug("[dunnes] JS state extraction failed", exc_info=True)
+            return []
 
-            if not js_data or not js_data.get("items"):
-                return []
+        for source, text in candidates or ():
+            try:
+                data = orjson.loads(text)
+            except orjson.JSONDecodeError:
+                continue
+            if source == "ld" and isinstance(data, dict):
+                data = data.get("itemListElement")
+            items = _find_product_list(data)
+            if not items:
+                continue
+            products = self._parse_js_items(items)
+            if products:
+                logger.debug("[dunnes] Found JS product data via %s", source)
+                return products
+        return []
+
+    def _parse_js_items(self, items: list[dict]) -> list[RawProduct]:
+        """Convert product dicts from embedded JSON into RawProducts."""
+        products: list[RawProduct] = []
+        for item in items:
+            try:
+                name = str(item.get("name") or item.get("title") or "").strip()
+                if not name:
+                    continue
 
-            products: list[RawProduct] = []
-            source = js_data.get("source", "unknown")
-            logger.debug("[dunnes] Found JS product data via %s", source)
-
-            for item in js_data["items"]:
-                try:
-                    name = str(item.get("name") or item.get("title") or "").strip()
-                    if not name:
-                        continue
-
-                    price_raw = item.get("price") or item.get("current_price") or 0
-                    price = self._parse_price(str(price_raw))
-                    if price is None or price == 0:
-                        continue
-
-                    sku = str(
-                        item.get("id")
-                        or item.get("sku")
-                        or item.get("product_id")
-                        or f"dunnes-{hash(name) % 1000000}"
-                    )
+                price_raw = item.get("price") or item.get("current_price") or 0
+                price = _parse_price(str(price_raw))
+                if price is None or price == 0:
+                    continue
 
-                    brand = item.get("brand") or None
-                    image_url = item.get("image") or item.get("image_url") or None
-                    product_url = item.get("url") or item.get("link") or None
-                    if product_url and not product_url.startswith("http"):
-                        product_url = f"{BASE_URL}{product_url}"
-
-                    # Promo handling
-                    promo_price = None
-                    promo_label = None
-                    original_price = item.get("original_price") or item.get("was_price")
-                    if original_price:
-                        op = self._parse_price(str(original_price))
-                        if op and op > price:
-                            promo_price = price
-                            price = op
-
-                    products.append(
-                        RawProduct(
-                            store_sku=sku,
-                            name=name,
-                            price=price,
-                            promo_price=promo_price,
-                            promo_label=promo_label,
-                            brand=brand,
-                            image_url=image_url,
-                            product_url=product_url,
-                        )
-                    )
-                except Exception:
-                    logger.debug("[dunnes] Failed to parse JS product item", exc_info=True)
+                sku = str(
+                    item.get("id")
+                    or item.get("sku")
+                    or item.get("product_id")
+                    or f"dunnes-{stable_hash(name)}"
+                )
 
-            return products
+                brand = item.get("brand") or None
+                image_url = item.get("image") or item.get("image_url") or None
+                product_url = item.get("url") or item.get("link") or None
+                if product_url and not product_url.startswith("http"):
+                    product_url = f"{BASE_URL}{product_url}"
 
-        except Exception:
-            logger.debug("[dunnes] JS state extraction failed", exc_info=True)
-            return []
+                # Promo handling
+                promo_price = None
+                promo_label = None
+                original_price = item.get("original_price") or item.get("was_price")
+                if original_price:
+                    op = _parse_price(str(original_price))
+                    if op and op > price:
+                        promo_price = price
+                        price = op
+
+                products.append(
+                    RawProduct(
+                        store_sku=sku,
+                        name=name,
+                        price=price,
+                        promo_price=promo_price,
+                        promo_label=promo_label,
+                        brand=brand,
+                        image_url=image_url,
+                        product_url=product_url,
+                    )
+                )
+            except Exception:
+                logger.debug("[dunnes] Failed to parse JS product item", exc_info=True)
+
+        return products
 
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
-    @staticmethod
-    def _parse_price(text: str) -> Decimal | None:
-        """Extract a decimal price from text like '€3.49' or '3,49'."""
-        if not text:
-            return None
-        cleaned = re.sub(r"[^\d.,]", "", text.strip())
-        cleaned = cleaned.replace(",", ".")
-        try:
-            return Decimal(cleaned) if cleaned else None
-        except InvalidOperation:
-            return None
+    async def _dismiss_overlays(self, page: Page) -> None:
+        """Click away cookie consent and other overlay banners.
 
-    @staticmethod
-    async def _dismiss_overlays(page: Page) -> None:
-        """Click away cookie consent and other overlay banners."""
-        for selector in [
-            "button:has-text('Accept All')",
-            "button:has-text('Accept Cookies')",
-            "button:has-text('Accept')",
-            "button[id*='cookie'] >> text=Accept",
-            "button[class*='cookie'] >> text=Accept",
-            "button[aria-label='Close']",
-        ]:
+        The selector that matched last is tried first, since the site
+        usually shows the same banner in every context; the rest are still
+        tried so a different banner on a fresh context is dismissed too.
+        """
+        hint = self._overlay_selector
+        selectors = _OVERLAY_SELECTORS
+        if hint is not None:
+            selectors = (hint, *(s for s in _OVERLAY_SELECTORS if s != hint))
+        for selector in selectors:
             try:
                 btn = page.locator(selector)
                 if await btn.count() > 0 and await btn.first.is_visible():
                     await btn.first.click()
+                    self._overlay_selector = selector
                     await asyncio.sleep(0.5)
                     break
             except Exception:
                 pass
 
     @staticmethod
-    async def _scroll_page(page: Page, scrolls: int = 6) -> None:
-        """Progressively scroll down to load lazy content."""
-        for _ in range(scrolls):
-            await page.evaluate("window.scrollBy(0, window.innerHeight)")
-            await asyncio.sleep(0.6)
+    async def _wait_for(page: Page, selector: str, timeout: int = 15_000) -> None:
+        """Wait until *selector* is attached, instead of sleeping a fixed time.
+
+        A timeout is not an error: the page may render its products in
+        another shape, which the extractors probe for anyway.
+        """
+        try:
+            await page.wait_for_selector(selector, state="attached", timeout=timeout)
+        except Exception:
+            logger.debug("[dunnes] %s did not appear on %s", selector, page.url)
+
+    @staticmethod
+    async def _wait_for_more_tiles(page: Page, before: int) -> None:
+        """Wait for a Load More click to append tiles.
+
+        ``networkidle`` could hang on analytics polling for the full timeout.
+        Pagination links that navigate instead settle on the new document.
+        """
+        try:
+            await page.wait_for_function(
+                "([sel, before]) => document.querySelectorAll(sel).length > before",
+                arg=[_TILE_SELECTOR, before],
+                timeout=8_000,
+            )
+        except Exception:
+            try:
+                await page.wait_for_load_state("domcontentloaded", timeout=15_000)
+            except Exception:
+                pass
 
     @staticmethod
-    async def _click_load_more(page: Page) -> bool:
-        """Try clicking a 'Load More' / pagination button. Return True if successful."""
-        for selector in [
-            "button:has-text('Load More')",
-            "button:has-text('Show More')",
-            "a:has-text('Load More')",
-            "button[data-ref='loadMore']",
-            "a[class*='pagination__next']",
-            "a[rel='next']",
-        ]:
+    async def _scroll_page(page: Page, max_scrolls: int = 12) -> None:
+        """Scroll to load lazy content until the page stops growing.
+
+        Stops after two scrolls that add neither tiles nor height, so short
+        categories finish early and long ones are not cut off at a fixed
+        count.  The whole loop runs in the page as a single round-trip.
+        """
+        await page.evaluate(_SCROLL_JS, [_TILE_SELECTOR, max_scrolls])
+
+    async def _click_load_more(self, page: Page) -> bool:
+        """Try clicking a 'Load More' / pagination button. Return True if successful.
+
+        Every category shares one layout, so the selector that matched last
+        is tried first instead of probing the whole list on each page.
+        """
+        hint = self._load_more_selector
+        selectors = _LOAD_MORE_SELECTORS
+        if hint is not None:
+            selectors = (hint, *(s for s in _LOAD_MORE_SELECTORS if s != hint))
+        for selector in selectors:
             try:
                 btn = page.locator(selector)
                 if await btn.count() > 0 and await btn.first.is_visible():
+                    before = await page.locator(_TILE_SELECTOR).count()
                     await btn.first.click()
-                    await page.wait_for_load_state("networkidle", timeout=15_000)
+                    self._load_more_selector = selector
+                    await self._wait_for_more_tiles(page, before)
                     return True
             except Exception:
                 pass
         return False
 
 
+# ------------------------------------------------------------------
+# Prices
+# ------------------------------------------------------------------
+@lru_cache(maxsize=4096)
+def _parse_price(text: str) -> Decimal | None:
+    """Extract a decimal price from text like '€3.49' or '3,49'.
+
+    The same few hundred price strings repeat across tiles and pages, and
+    Decimals are immutable, so results are cached.
+    """
+    if not text:
+        return None
+    cleaned = _RE_PRICE_JUNK.sub("", text.strip())
+    cleaned = cleaned.replace(",", ".")
+    try:
+        return Decimal(cleaned) if cleaned else None
+    except InvalidOperation:
+        return None
+
+
+# ------------------------------------------------------------------
+# Embedded JSON
+# ------------------------------------------------------------------
+# A list counts as products when its first entry has a name and a price
+_PRICE_KEYS = ("price", "current_price")
+
+
+def _find_product_list(data: object, max_depth: int = 8) -> list[dict]:
+    """Return the shallowest list of product-like dicts nested in *data*."""
+    queue = deque([(data, 0)])
+    while queue:
+        node, depth = queue.popleft()
+        if isinstance(node, list):
+            first = node[0] if node else None
+            if (
+                isinstance(first, dict)
+                and ("name" in first or "title" in first)
+                and any(key in first for key in _PRICE_KEYS)
+            ):
+                return node
+            children = node
+        elif isinstance(node, dict):
+            children = node.values()
+        else:
+            continue
+        if depth < max_depth:
+            queue.extend(
+                (child, depth + 1) for child in children if isinstance(child, (list, dict))
+            )
+    return []
+
+
+def _embedded_product_list(doc: HtmlElement) -> tuple[str, list[dict]] | None:
+    """Find a product list in a served page's __NEXT_DATA__ or ld+json scripts."""
+    for script in doc.iterfind(".//script"):
+        if script.get("id") == "__NEXT_DATA__":
+            source = "next"
+        elif script.get("type") == "application/ld+json":
+            source = "ld"
+        else:
+            continue
+        try:
+            data = orjson.loads(script.text or "")
+        except orjson.JSONDecodeError:
+            continue
+        if source == "ld" and isinstance(data, dict):
+            data = data.get("itemListElement")
+        items = _find_product_list(data)
+        if items:
+            return source, items
+    return None
+
+
+# ------------------------------------------------------------------
+# Server-rendered tiles
+# ------------------------------------------------------------------
+# One compound selector: optional tag, then .class / [attr] / [attr='v'] /
+# [attr*='v'] parts -- the only forms the selector constants above use
+_RE_CSS_COMPOUND = re.compile(r"^(\w+)?((?:\.[\w-]+|\[[\w-]+(?:\*?='[^']*')?\])*)$")
+_RE_CSS_PART = re.compile(r"\.([\w-]+)|\[([\w-]+)(?:(\*?=)'([^']*)')?\]")
+
+
+def _css_xpath(selector_list: str) -> etree.XPath:
+    """Compile a selector-list constant to an XPath relative to the context node.
+
+    Covers just the CSS subset used in this module, so the httpx path and
+    the browser read tiles with the same selectors and no cssselect
+    dependency.  Union results come back in document order, like
+    ``querySelectorAll``.
+    """
+    paths = []
+    for selector in selector_list.split(","):
+        steps = []
+        for compound in selector.split():
+            match = _RE_CSS_COMPOUND.match(compound)
+            if match is None:
+                raise ValueError(f"Unsupported selector: {compound!r}")
+            predicates = ""
+            for cls, attr, op, value in _RE_CSS_PART.findall(match.group(2)):
+                if cls:
+                    predicates += (
+                        f"[contains(concat(' ', normalize-space(@class), ' '), ' {cls} ')]"
+                    )
+                elif op == "*=":
+                    predicates += f"[contains(@{attr}, '{value}')]"
+                elif op == "=":
+                    predicates += f"[@{attr}='{value}']"
+                else:
+                    predicates += f"[@{attr}]"
+            steps.append(f"descendant::{match.group(1) or '*'}{predicates}")
+        paths.append("/".join(steps))
+    return etree.XPath(" | ".join(paths))
+
+
+_XPATH_TILES = _css_xpath(_TILE_SELECTOR)
+_XPATH_TILES_FALLBACK = _css_xpath(_TILE_SELECTOR_FALLBACK)
+_XPATH_NAME = _css_xpath(_NAME_SELECTOR)
+_XPATH_PRICE = _css_xpath(_PRICE_SELECTOR)
+_XPATH_PROMO = _css_xpath(_PROMO_SELECTOR)
+_XPATH_UNIT_PRICE = _css_xpath(_UNIT_PRICE_SELECTOR)
+_XPATH_LINK = etree.XPath("descendant::a[1]")
+# Pagination in served HTML: links are followed, a bare button needs a browser
+_XPATH_NEXT_HREF = etree.XPath(
+    "(//a[@rel='next'] | //a[contains(@class, 'pagination__next')]"
+    " | //a[contains(., 'Load More')])[@href != ''][1]/@href"
+)
+_XPATH_LOAD_MORE_BUTTON = etree.XPath(
+    "//button[@data-ref='loadMore' or contains(., 'Load More') or contains(., 'Show More')]"
+)
+_XPATH_IMG = etree.XPath("descendant::img[1]")
+
+
+def _first_text(tile: HtmlElement, xpath: etree.XPath) -> str:
+    found = xpath(tile)
+    return " ".join(found[0].text_content().split()) if found else ""
+
+
+def _tile_rows(doc: HtmlElement) -> list[dict]:
+    """Read product tiles from served HTML into the rows the browser pass returns."""
+    tiles = _XPATH_TILES(doc) or _XPATH_TILES_FALLBACK(doc)
+    rows = []
+    for tile in tiles:
+        names = _XPATH_NAME(tile)
+        name = " ".join(names[0].text_content().split()) if names else ""
+        href = (names[0].get("href") or "") if names else ""
+        if not name:
+            links = _XPATH_LINK(tile)
+            if links:
+                name = " ".join(links[0].text_content().split())
+                href = links[0].get("href") or ""
+        imgs = _XPATH_IMG(tile)
+        rows.append(
+            {
+                "name": name,
+                "href": href,
+                "sku": tile.get("data-product-id")
+                or tile.get("data-sku")
+                or tile.get("data-ref")
+                or "",
+                "price": _first_text(tile, _XPATH_PRICE),
+                "promo": _first_text(tile, _XPATH_PROMO),
+                "image": (imgs[0].get("src") or imgs[0].get("data-src")) if imgs else None,
+                "unit": _first_text(tile, _XPATH_UNIT_PRICE),
+            }
+        )
+    return rows
+
+
 # ------------------------------------------------------------------
 # Standalone entry point
 # ------------------------------------------------------------------
@@ -567,7 +954,7 @@ async def main() -> None:
     scraper = DunnesScraper()
     result = await scraper.run()
     print(f"\nDone: {result.status}")
-    print(f"Products scraped: {len(result.products)}")
+    print(f"Products scraped: {result.products_scraped}")
     if result.errors:
         print(f"Errors ({len(result.errors)}):")
         for err in result.errors:
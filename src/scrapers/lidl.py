@@ -18,13 +18,16 @@ The grocery landing page at ``/grocery-range`` contains links to both types.
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 import re
 from decimal import Decimal, InvalidOperation
+from typing import Mapping
 
 import httpx
-from bs4 import BeautifulSoup
+import orjson
+from lxml import etree
+from lxml import html as lxml_html
+from lxml.html import HtmlElement
 from playwright.async_api import Page
 
 from src.scrapers.base import (
@@ -33,6 +36,7 @@ from src.scrapers.base import (
     DEFAULT_HEADERS,
     random_delay,
     random_user_agent,
+    stable_hash,
 )
 
 logger = logging.getLogger(__name__)
@@ -54,9 +58,37 @@ WEEKLY_OFFERS_URLS = [
     f"{BASE_URL}/c/lidl-plus-offers/a10073407",
 ]
 
+# Regexes used per category URL and per tile
+_RE_CAMPAIGN = re.compile(r"/c/.+/a\d+")
+_RE_PACKAGING_SIZE = re.compile(r"(\d+(?:[.,]\d+)?)\s*(ml|l|g|kg|cl|pk|pack|cm)\b", re.IGNORECASE)
+_RE_NAME_SIZE = re.compile(r"(\d+(?:[.,]\d+)?)\s*(ml|l|g|kg|cl|pk|pack)\b", re.IGNORECASE)
+_RE_PRICE_JUNK = re.compile(r"[^\d.,]")
+
+# Compiled XPath for the server-rendered pages.  Tiles are the confirmed SSR
+# placeholder class, or any element carrying a data-grid-data attribute.
+_XPATH_TILES = etree.XPath(
+    "//div[contains(concat(' ', normalize-space(@class), ' '),"
+    " ' AProductGridbox__GridTilePlaceholder ')]"
+    " | //*[@data-grid-data]"
+)
+_XPATH_CATEGORY_HREFS = etree.XPath("//a[contains(@href, '/c/')]/@href")
+_XPATH_NEXT_HREF = etree.XPath(
+    "(//a[@rel='next']"
+    " | //a[contains(concat(' ', normalize-space(@class), ' '), ' pagination__next ')]"
+    " | //a[@aria-label='Next']"
+    " | //li[contains(concat(' ', normalize-space(@class), ' '), ' next ')]//a"
+    ")[@href != ''][1]/@href"
+)
+
 
 class LidlScraper(BaseScraper):
     store_slug = "lidl"
+    # Categories share one httpx client and one pooled browser, so a few can
+    # be in flight at once without opening extra connections or Chromiums
+    max_concurrency = 4
+
+    def __init__(self) -> None:
+        self._client: httpx.AsyncClient | None = None
 
     # ------------------------------------------------------------------
     # Category URLs
@@ -93,17 +125,14 @@ class LidlScraper(BaseScraper):
 
     async def _discover_categories_httpx(self) -> list[str]:
         """Discover category links from /grocery-range using httpx."""
-        headers = {**DEFAULT_HEADERS, "User-Agent": random_user_agent()}
-        async with httpx.AsyncClient(
-            headers=headers, follow_redirects=True, timeout=30.0,
-        ) as client:
-            resp = await client.get(f"{BASE_URL}/grocery-range")
-            resp.raise_for_status()
-
-        soup = BeautifulSoup(resp.text, "html.parser")
+        resp = await self._get_client().get(
+            f"{BASE_URL}/grocery-range", headers={"User-Agent": random_user_agent()}
+        )
+        resp.raise_for_status()
+
+        doc = lxml_html.fromstring(resp.text)
         links: set[str] = set()
-        for a_tag in soup.select("a[href*='/c/']"):
-            href = a_tag.get("href", "")
+        for href in _XPATH_CATEGORY_HREFS(doc):
             if not href:
                 continue
             if not href.startswith("http"):
@@ -121,39 +150,34 @@ class LidlScraper(BaseScraper):
 
     async def _discover_categories_playwright(self) -> list[str]:
         """Discover category URLs from /grocery-range using Playwright."""
-        pw, browser, context = await self._get_browser_context(headless=True)
         try:
-            page = await context.new_page()
-            logger.info("[lidl] Discovering categories from %s/grocery-range", BASE_URL)
-            await page.goto(
-                f"{BASE_URL}/grocery-range",
-                wait_until="domcontentloaded",
-                timeout=60_000,
-            )
-            await asyncio.sleep(3)
-            await self._dismiss_overlays(page)
+            async with self._pooled_page() as page:
+                logger.info("[lidl] Discovering categories from %s/grocery-range", BASE_URL)
+                await page.goto(
+                    f"{BASE_URL}/grocery-range",
+                    wait_until="domcontentloaded",
+                    timeout=60_000,
+                )
+                await asyncio.sleep(3)
+                await self._dismiss_overlays(page)
 
-            links = await page.evaluate('''() => {
-                return [...document.querySelectorAll('a[href*="/c/"]')]
-                    .map(a => a.href.split("?")[0])
-                    .filter((v, i, a) => a.indexOf(v) === i);
-            }''')
-            return list(set(links))
+                links = await page.evaluate('''() => {
+                    return [...document.querySelectorAll('a[href*="/c/"]')]
+                        .map(a => a.href.split("?")[0])
+                        .filter((v, i, a) => a.indexOf(v) === i);
+                }''')
+                return list(set(links))
 
         except Exception:
             logger.warning("[lidl] Playwright category discovery failed", exc_info=True)
             return []
-        finally:
-            await context.close()
-            await browser.close()
-            await pw.stop()
 
     # ------------------------------------------------------------------
     # Scrape one category
     # ------------------------------------------------------------------
     async def scrape_category(self, category_url: str) -> list[RawProduct]:
         # Campaign / offer pages (/a{id}) have SSR product tiles -- try httpx
-        if re.search(r"/c/.+/a\d+", category_url):
+        if _RE_CAMPAIGN.search(category_url):
             return await self._scrape_with_httpx(category_url)
 
         # Static range pages (/s{id}) and other pages are JS-rendered
@@ -165,64 +189,80 @@ class LidlScraper(BaseScraper):
     # ------------------------------------------------------------------
     async def _scrape_with_httpx(self, category_url: str) -> list[RawProduct]:
         products: list[RawProduct] = []
-        headers = {**DEFAULT_HEADERS, "User-Agent": random_user_agent()}
-
-        async with httpx.AsyncClient(
-            headers=headers,
-            follow_redirects=True,
-            timeout=30.0,
-        ) as client:
-            page_num = 1
-            current_url = category_url
-
-            while current_url:
-                logger.info("[lidl] Fetching %s", current_url)
-                response = await client.get(current_url)
-                response.raise_for_status()
-
-                soup = BeautifulSoup(response.text, "html.parser")
-                batch = self._parse_html(soup)
-                products.extend(batch)
-
-                logger.info(
-                    "[lidl] Page %d: parsed %d products (total %d)",
-                    page_num,
-                    len(batch),
-                    len(products),
-                )
+        client = self._get_client()
+        headers = {"User-Agent": random_user_agent()}
+
+        page_num = 1
+        current_url = category_url
+
+        while current_url:
+            logger.info("[lidl] Fetching %s", current_url)
+            response = await client.get(current_url, headers=headers)
+            response.raise_for_status()
+            if not response.content:
+                logger.warning("[lidl] Empty response from %s", current_url)
+                break
+
+            doc = lxml_html.fromstring(response.text)
+            batch = self._parse_html(doc)
+            products.extend(batch)
+
+            logger.info(
+                "[lidl] Page %d: parsed %d products (total %d)",
+                page_num,
+                len(batch),
+                len(products),
+            )
 
-                if not batch:
-                    # No products found -- page may need JS rendering
-                    logger.warning(
-                        "[lidl] httpx returned 0 products for %s; "
-                        "page may require Playwright",
-                        current_url,
-                    )
-
-                # Pagination -- Lidl campaign pages do not typically paginate,
-                # but we keep this in case they start.
-                next_link = soup.select_one(
-                    "a[rel='next'], "
-                    "a.pagination__next, "
-                    "a[aria-label='Next'], "
-                    "li.next a"
+            if not batch:
+                # No products found -- page may need JS rendering
+                logger.warning(
+                    "[lidl] httpx returned 0 products for %s; "
+                    "page may require Playwright",
+                    current_url,
                 )
-                if next_link and next_link.get("href"):
-                    next_href = next_link["href"]
-                    if not next_href.startswith("http"):
-                        next_href = f"{BASE_URL}{next_href}"
-                    current_url = next_href
-                    page_num += 1
-                    await random_delay(1.0, 2.5)
-                else:
-                    current_url = None
+
+            # Pagination -- Lidl campaign pages do not typically paginate,
+            # but we keep this in case they start.
+            next_hrefs = _XPATH_NEXT_HREF(doc)
+            if next_hrefs:
+                next_href = next_hrefs[0]
+                if not next_href.startswith("http"):
+                    next_href = f"{BASE_URL}{next_href}"
+                current_url = next_href
+                page_num += 1
+                await random_delay(1.0, 2.5)
+            else:
+                current_url = None
 
         return products
 
+    def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared httpx client, creating it on first use.
+
+        One client is kept for the whole run so discovery, every category
+        and every page reuse the same keep-alive (HTTP/2) connections.
+        """
+        if self._client is None:
+            self._client = httpx.AsyncClient(
+                headers=DEFAULT_HEADERS,
+                http2=True,
+                follow_redirects=True,
+                timeout=30.0,
+                limits=httpx.Limits(max_connections=16, max_keepalive_connections=16),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+        await super().aclose()
+
     # ------------------------------------------------------------------
     # HTML parsing -- extract from data-grid-data JSON attributes
     # ------------------------------------------------------------------
-    def _parse_html(self, soup: BeautifulSoup) -> list[RawProduct]:
+    def _parse_html(self, doc: HtmlElement) -> list[RawProduct]:
         """Parse product tiles from a Lidl page.
 
         Lidl embeds product data as a JSON blob in the ``data-grid-data``
@@ -232,14 +272,7 @@ class LidlScraper(BaseScraper):
         """
         products: list[RawProduct] = []
 
-        # Primary selector: the confirmed SSR tile class.
-        # Also match any element with a data-grid-data attribute as fallback.
-        tiles = soup.select(
-            "div.AProductGridbox__GridTilePlaceholder, "
-            "[data-grid-data]"
-        )
-
-        for tile in tiles:
+        for tile in _XPATH_TILES(doc):
             try:
                 product = self._parse_tile(tile)
                 if product is not None:
@@ -249,7 +282,7 @@ class LidlScraper(BaseScraper):
 
         return products
 
-    def _parse_tile(self, tile) -> RawProduct | None:
+    def _parse_tile(self, tile: HtmlElement) -> RawProduct | None:
         """Extract a RawProduct from a single tile element.
 
         Data is primarily extracted from the ``data-grid-data`` JSON
@@ -261,15 +294,28 @@ class LidlScraper(BaseScraper):
         grid_data: dict = {}
         if grid_data_raw:
             try:
-                grid_data = json.loads(grid_data_raw)
-            except (json.JSONDecodeError, TypeError):
+                grid_data = orjson.loads(grid_data_raw)
+            except (orjson.JSONDecodeError, TypeError):
                 logger.debug("[lidl] Invalid JSON in data-grid-data")
+        return self._build_raw_product(grid_data, tile.attrib)
+
+    def _build_raw_product(
+        self, grid_data: dict, tile_attrs: Mapping[str, str] | None = None
+    ) -> RawProduct | None:
+        """Build a RawProduct from a parsed ``data-grid-data`` dict.
+
+        *tile_attrs* are the tile element's HTML attributes, used as a
+        fallback for fields missing from the JSON.  Playwright-extracted
+        items have none.
+        """
+        if tile_attrs is None:
+            tile_attrs = {}
 
         # --- Name ---
         name = (
             grid_data.get("fullTitle")
             or grid_data.get("title")
-            or tile.get("fulltitle", "")
+            or tile_attrs.get("fulltitle", "")
         )
         if not name:
             return None
@@ -279,18 +325,18 @@ class LidlScraper(BaseScraper):
             grid_data.get("productId")
             or grid_data.get("itemId")
             or grid_data.get("erpNumber")
-            or tile.get("productid", "")
-            or tile.get("itemid", "")
+            or tile_attrs.get("productid", "")
+            or tile_attrs.get("itemid", "")
         )
         if not product_id:
-            product_id = f"lidl-{hash(name) % 1000000}"
+            product_id = f"lidl-{stable_hash(name)}"
 
         # --- Product URL ---
         canonical = (
             grid_data.get("canonicalUrl")
             or grid_data.get("canonicalPath")
-            or tile.get("canonicalurl", "")
-            or tile.get("canonicalpath", "")
+            or tile_attrs.get("canonicalurl", "")
+            or tile_attrs.get("canonicalpath", "")
         )
         product_url = None
         if canonical:
@@ -362,7 +408,7 @@ class LidlScraper(BaseScraper):
             return None
 
         # --- Image ---
-        image_url = grid_data.get("image") or tile.get("image")
+        image_url = grid_data.get("image") or tile_attrs.get("image")
         if not image_url:
             image_list = grid_data.get("imageList") or grid_data.get("imageList_V1")
             if image_list and isinstance(image_list, list):
@@ -384,7 +430,7 @@ class LidlScraper(BaseScraper):
             brand = brand_obj.get("name")
 
         # --- Category ---
-        category = grid_data.get("category") or tile.get("category")
+        category = grid_data.get("category") or tile_attrs.get("category")
 
         # --- EAN ---
         ean = None
@@ -408,11 +454,7 @@ class LidlScraper(BaseScraper):
             packaging_text = price_obj.get("packaging", {}).get("text")
 
         if packaging_text:
-            size_match = re.search(
-                r"(\d+(?:[.,]\d+)?)\s*(ml|l|g|kg|cl|pk|pack|cm)\b",
-                packaging_text,
-                re.IGNORECASE,
-            )
+            size_match = _RE_PACKAGING_SIZE.search(packaging_text)
             if size_match:
                 try:
                     unit_size = Decimal(size_match.group(1).replace(",", "."))
@@ -422,11 +464,7 @@ class LidlScraper(BaseScraper):
 
         # Fall back: extract unit/size from product name
         if unit_size is None:
-            size_match = re.search(
-                r"(\d+(?:[.,]\d+)?)\s*(ml|l|g|kg|cl|pk|pack)\b",
-                name,
-                re.IGNORECASE,
-            )
+            size_match = _RE_NAME_SIZE.search(name)
             if size_match:
                 try:
                     unit_size = Decimal(size_match.group(1).replace(",", "."))
@@ -496,9 +534,7 @@ class LidlScraper(BaseScraper):
         After Playwright renders the page, we extract the same
         ``data-grid-data`` JSON that the httpx path uses.
         """
-        pw, browser, context = await self._get_browser_context(headless=True)
-        try:
-            page = await context.new_page()
+        async with self._pooled_page() as page:
             logger.info("[lidl] Playwright loading %s", url)
             await page.goto(url, wait_until="domcontentloaded", timeout=60_000)
             await asyncio.sleep(3)
@@ -507,8 +543,7 @@ class LidlScraper(BaseScraper):
             await self._scroll_page(page, scrolls=8)
 
             html = await page.content()
-            soup = BeautifulSoup(html, "html.parser")
-            products = self._parse_html(soup)
+            products = self._parse_html(lxml_html.fromstring(html))
 
             # If _parse_html found nothing, try extracting from Playwright
             # locators directly (the data-grid-data may also be available
@@ -518,11 +553,6 @@ class LidlScraper(BaseScraper):
 
             return products
 
-        finally:
-            await context.close()
-            await browser.close()
-            await pw.stop()
-
     async def _extract_from_playwright(self, page: Page) -> list[RawProduct]:
         """Extract products directly from the Playwright page DOM.
 
@@ -544,7 +574,7 @@ class LidlScraper(BaseScraper):
 
         for gd in raw_items:
             try:
-                product = self._parse_grid_data_dict(gd)
+                product = self._build_raw_product(gd)
                 if product is not None:
                     products.append(product)
             except Exception:
@@ -553,20 +583,6 @@ class LidlScraper(BaseScraper):
         logger.info("[lidl] Playwright JS extraction found %d products", len(products))
         return products
 
-    def _parse_grid_data_dict(self, grid_data: dict) -> RawProduct | None:
-        """Parse a RawProduct from a pre-parsed data-grid-data dict.
-
-        Shares logic with ``_parse_tile`` but takes a plain dict instead
-        of a BeautifulSoup element.
-        """
-        # Build a minimal mock tag with the grid_data as attribute
-        # so we can reuse _parse_tile.  This is a lightweight approach.
-        from bs4 import Tag
-
-        tag = Tag(name="div")
-        tag["data-grid-data"] = json.dumps(grid_data)
-        return self._parse_tile(tag)
-
     # ------------------------------------------------------------------
     # Helpers
     # ------------------------------------------------------------------
@@ -574,7 +590,7 @@ class LidlScraper(BaseScraper):
     def _parse_price(text: str) -> Decimal | None:
         if not text:
             return None
-        cleaned = re.sub(r"[^\d.,]", "", text.strip())
+        cleaned = _RE_PRICE_JUNK.sub("", text.strip())
         cleaned = cleaned.replace(",", ".")
         try:
             return Decimal(cleaned) if cleaned else None
@@ -617,7 +633,7 @@ async def main() -> None:
     scraper = LidlScraper()
     result = await scraper.run()
     print(f"\nDone: {result.status}")
-    print(f"Products scraped: {len(result.products)}")
+    print(f"Products scraped: {result.products_scraped}")
     if result.errors:
         print(f"Errors ({len(result.errors)}):")
         for err in result.errors:
@@ -23,6 +23,7 @@ from src.scrapers.base import (
     BaseScraper,
     RawProduct,
     random_delay,
+    stable_hash,
 )
 
 logger = logging.getLogger(__name__)
@@ -342,7 +343,7 @@ class SuperValuScraper(BaseScraper):
                     sku_match = re.search(r"/(\d{5,})", href)
                     sku = sku_match.group(1) if sku_match else ""
                 if not sku:
-                    sku = f"sv-{hash(name) % 1000000}"
+                    sku = f"sv-{stable_hash(name)}"
 
                 # --- EAN (SuperValu sometimes exposes it) ---
                 ean = await tile.get_attribute("data-product-ean") or None
@@ -510,7 +511,7 @@ async def main() -> None:
     scraper = SuperValuScraper()
     result = await scraper.run()
     print(f"\nDone: {result.status}")
-    print(f"Products scraped: {len(result.products)}")
+    print(f"Products scraped: {result.products_scraped}")
     if result.errors:
         print(f"Errors ({len(result.errors)}):")
         for err in result.errors:
@@ -331,7 +331,7 @@ async def main() -> None:
         scraper = TescoScraper()
         result = await scraper.run()
         print(f"\nDone: {result.status}")
-        print(f"Products scraped: {len(result.products)}")
+        print(f"Products scraped: {result.products_scraped}")
         if result.errors:
             print(f"Errors ({len(result.errors)}):")
             for err in result.errors:
@@ -239,3 +239,27 @@ class TestGetProduct:
         assert data["id"] == 2
         assert data["category"] is None
         assert data["ean"] is None
+
+
+# =========================================================================
+# /api/search-prices
+# =========================================================================
+
+
+class TestSearchPrices:
+    """Tests for ``GET /api/search-prices``."""
+
+    async def test_search_prices_sort_effective(self, client, mock_session):
+        """``sort=effective`` should be accepted."""
+        result_mock = MagicMock()
+        result_mock.all.return_value = []
+        mock_session.execute.return_value = result_mock
+
+        response = await client.get("/api/search-prices?q=milk&sort=effective")
+        assert response.status_code == 200
+        assert response.json() == []
+
+    async def test_search_prices_invalid_sort(self, client):
+        """An unknown sort key should be rejected."""
+        response = await client.get("/api/search-prices?q=milk&sort=price")
+        assert response.status_code == 422
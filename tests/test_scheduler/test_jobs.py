@@ -0,0 +1,66 @@
+"""Tests for src.scheduler.jobs."""
+
+from __future__ import annotations
+
+import pytest
+
+from src.scheduler import jobs
+from src.scrapers import base
+from src.scrapers.base import BaseScraper, RawProduct, ScrapeResult
+
+
+class _FakeBrowser:
+    def __init__(self) -> None:
+        self.closed = False
+
+    def is_connected(self) -> bool:
+        return not self.closed
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class _BrowserScraper(BaseScraper):
+    """Scraper whose run() only acquires a browser, like a Playwright category."""
+
+    store_slug = "fake"
+    instances: list[_BrowserScraper] = []
+
+    def __init__(self) -> None:
+        self.used_browser = None
+        self.instances.append(self)
+
+    async def get_category_urls(self) -> list[str]:
+        return []
+
+    async def scrape_category(self, category_url: str) -> list[RawProduct]:
+        return []
+
+    async def run(self) -> ScrapeResult:
+        self.used_browser = await self._ensure_browser()
+        await self.aclose()
+        return ScrapeResult(store_slug=self.store_slug)
+
+
+class TestRunScraper:
+    """Tests for ``jobs._run_scraper``."""
+
+    @pytest.fixture(autouse=True)
+    def _registry(self, monkeypatch):
+        _BrowserScraper.instances = []
+        monkeypatch.setattr(jobs, "SCRAPERS", {"fake": _BrowserScraper})
+
+    async def test_runs_registered_scraper_on_shared_browser(self, monkeypatch):
+        shared = _FakeBrowser()
+        monkeypatch.setattr(base, "_shared_browser", (object(), shared))
+
+        await jobs._run_scraper("fake")
+
+        (scraper,) = _BrowserScraper.instances
+        assert scraper.used_browser is shared
+        # The borrowed browser outlives the run
+        assert not shared.closed
+
+    async def test_unknown_slug_is_skipped(self):
+        await jobs._run_scraper("nope")
+        assert _BrowserScraper.instances == []
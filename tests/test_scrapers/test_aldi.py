@@ -0,0 +1,145 @@
+"""Tests for the Aldi scraper's category fallback and SKU bookkeeping."""
+
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from decimal import Decimal
+
+import httpx
+import pytest
+
+from src.scrapers import aldi
+from src.scrapers.aldi import BASE_URL, AldiScraper
+
+MEAT_URL = f"{BASE_URL}/products/fresh-meat/"
+FOOD_URL = f"{BASE_URL}/products/fresh-food/"
+
+
+def _page(*skus: str, next_href: str | None = None) -> str:
+    tiles = "".join(
+        f'<div class="product-tile" data-product-id="{sku}">'
+        f'<a href="/p/{sku}">Product {sku}</a>'
+        '<span class="product-tile__price">€1,49</span>'
+        "</div>"
+        for sku in skus
+    )
+    pager = f'<a rel="next" href="{next_href}">Next</a>' if next_href else ""
+    return f"<html><body>{tiles}{pager}</body></html>"
+
+
+class _RenderedPage:
+    def __init__(self, url: str, html: str) -> None:
+        self.url = url
+        self.html = html
+
+    async def content(self) -> str:
+        return self.html
+
+
+class TestCategoryFallback:
+    """A failed httpx attempt must not hide products from later attempts."""
+
+    @pytest.fixture(autouse=True)
+    def _offline(self, monkeypatch):
+        # Served pages by URL; a missing URL answers 500
+        self.served: dict[str, str] = {}
+        # What the Playwright fallback renders, by URL; a missing URL raises
+        self.rendered: dict[str, str] = {}
+
+        async def _no_delay(*args, **kwargs):
+            return None
+
+        async def _no_api(scraper, page, url, tile_selector):
+            return []
+
+        async def _noop(*args, **kwargs):
+            return None
+
+        @asynccontextmanager
+        async def _fake_pooled_page(scraper):
+            yield self._current_page
+
+        async def _fake_playwright(scraper, category_url):
+            if category_url not in self.rendered:
+                raise RuntimeError("browser failed")
+            self._current_page = _RenderedPage(category_url, self.rendered[category_url])
+            return await _original_playwright(scraper, category_url)
+
+        _original_playwright = AldiScraper._scrape_with_playwright
+        monkeypatch.setattr(aldi, "random_delay", _no_delay)
+        monkeypatch.setattr(AldiScraper, "_intercept_api", _no_api)
+        monkeypatch.setattr(AldiScraper, "_dismiss_overlays", staticmethod(_noop))
+        monkeypatch.setattr(AldiScraper, "_scroll_page", staticmethod(_noop))
+        monkeypatch.setattr(AldiScraper, "_wait_for_tiles", staticmethod(_noop))
+        monkeypatch.setattr(AldiScraper, "_pooled_page", _fake_pooled_page)
+        monkeypatch.setattr(AldiScraper, "_scrape_with_playwright", _fake_playwright)
+        # Parse on the default thread pool instead of spawning processes
+        monkeypatch.setattr(AldiScraper, "_get_parse_pool", lambda scraper: None)
+
+    def _scraper(self) -> AldiScraper:
+        def _handler(request: httpx.Request) -> httpx.Response:
+            body = self.served.get(str(request.url))
+            if body is None:
+                return httpx.Response(500)
+            return httpx.Response(200, text=body)
+
+        scraper = AldiScraper()
+        scraper._client = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+        return scraper
+
+    async def test_playwright_fallback_keeps_skus_from_failed_httpx_pages(self):
+        self.served[MEAT_URL] = _page("1", "2", next_href=f"{MEAT_URL}?page=2")
+        self.rendered[MEAT_URL] = _page("1", "2")
+        scraper = self._scraper()
+
+        products = await scraper.scrape_category(MEAT_URL)
+        await scraper._client.aclose()
+
+        assert [p.store_sku for p in products] == ["1", "2"]
+        assert scraper._seen_skus == {"1", "2"}
+
+    async def test_failed_category_does_not_claim_shared_skus(self):
+        self.served[MEAT_URL] = _page("1", next_href=f"{MEAT_URL}?page=2")
+        self.served[FOOD_URL] = _page("1", "3")
+        scraper = self._scraper()
+
+        with pytest.raises(RuntimeError):
+            await scraper.scrape_category(MEAT_URL)
+        products = await scraper.scrape_category(FOOD_URL)
+        await scraper._client.aclose()
+
+        assert [p.store_sku for p in products] == ["1", "3"]
+
+    async def test_finished_category_filters_later_ones(self):
+        self.served[MEAT_URL] = _page("1", "2")
+        self.served[FOOD_URL] = _page("2", "3")
+        scraper = self._scraper()
+
+        await scraper.scrape_category(MEAT_URL)
+        products = await scraper.scrape_category(FOOD_URL)
+        await scraper._client.aclose()
+
+        assert [p.store_sku for p in products] == ["3"]
+
+
+class TestParseOccProduct:
+    """Tests for ``AldiScraper._parse_occ_product``."""
+
+    def test_unhashable_unit_price_keeps_product(self):
+        item = {
+            "code": "42",
+            "name": "Milk 2L",
+            "price": {"value": 1.89},
+            "basePrice": {"value": {"amount": 0.95}, "unit": "l"},
+        }
+        product = AldiScraper()._parse_occ_product(item)
+
+        assert product is not None
+        assert product.price == Decimal("1.89")
+        assert product.unit_price is None
+
+    def test_to_decimal(self):
+        assert aldi._to_decimal(1.5) == Decimal("1.5")
+        assert aldi._to_decimal("2") == Decimal("2")
+        for value in (None, "n/a", [1], {"value": 1}):
+            assert aldi._to_decimal(value) is None
@@ -2,17 +2,26 @@
 
 from __future__ import annotations
 
+import asyncio
 from datetime import datetime, timedelta
 from decimal import Decimal
 
 import pytest
+from sqlalchemy import create_engine, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
 
+from src.core.database import Base
+from src.core.models import Category, PriceRecord, Product, Store, StoreProduct
+from src.scrapers import base
 from src.scrapers.base import (
     DEFAULT_HEADERS,
     USER_AGENTS,
+    BaseScraper,
     RawProduct,
     ScrapeResult,
     random_user_agent,
+    stable_hash,
 )
 
 
@@ -84,6 +93,12 @@ class TestRawProduct:
         rp = RawProduct(store_sku="X", name="Y", price=Decimal("1"))
         assert rp.in_stock is True
 
+    def test_raw_product_is_slotted(self):
+        rp = RawProduct(store_sku="X", name="Y", price=Decimal("1"))
+        assert not hasattr(rp, "__dict__")
+        with pytest.raises(AttributeError):
+            rp.colour = "red"
+
 
 # =========================================================================
 # ScrapeResult
@@ -120,6 +135,11 @@ class TestScrapeResult:
         )
         assert result.status == "partial"
 
+    def test_status_partial_with_counted_products(self):
+        """run() only counts products; the count drives the status."""
+        result = ScrapeResult(store_slug="tesco", products_scraped=3, errors=["x"])
+        assert result.status == "partial"
+
     def test_status_success_no_products_no_errors(self):
         """No products and no errors -> 'success' (degenerate but valid)."""
         result = ScrapeResult(store_slug="tesco", products=[], errors=[])
@@ -182,6 +202,27 @@ class TestRandomUserAgent:
         assert len(results) > 1
 
 
+# =========================================================================
+# stable_hash
+# =========================================================================
+
+
+class TestStableHash:
+    """Tests for ``stable_hash``."""
+
+    def test_known_digest(self):
+        """The digest must not depend on the interpreter's hash seed."""
+        assert stable_hash("Avonmore Milk 2L") == "785f06dbe011a717"
+
+    def test_is_16_hex_chars(self):
+        digest = stable_hash("anything")
+        assert len(digest) == 16
+        int(digest, 16)
+
+    def test_different_inputs_differ(self):
+        assert stable_hash("Milk 1L") != stable_hash("Milk 2L")
+
+
 # =========================================================================
 # Module-level constants
 # =========================================================================
@@ -198,3 +239,463 @@ class TestConstants:
 
     def test_default_headers_has_accept_language(self):
         assert "Accept-Language" in DEFAULT_HEADERS
+
+
+# =========================================================================
+# _unsaveable_reason
+# =========================================================================
+
+
+class TestUnsaveableReason:
+    """Tests for the pre-save row check in ``base``."""
+
+    def test_valid_product(self):
+        rp = RawProduct(store_sku="A", name="Milk", price=Decimal("2.49"), ean="5011038123456")
+        assert base._unsaveable_reason(rp) is None
+
+    def test_missing_required_fields(self):
+        assert base._unsaveable_reason(RawProduct("", "Milk", Decimal("1"))) == "no store_sku"
+        assert base._unsaveable_reason(RawProduct("A", "", Decimal("1"))) == "no name"
+        assert base._unsaveable_reason(RawProduct("A", "Milk", None)) == "no price"
+
+    def test_string_longer_than_column(self):
+        rp = RawProduct(store_sku="A", name="Milk", price=Decimal("1"), ean="1" * 14)
+        assert base._unsaveable_reason(rp) == "ean longer than 13 characters"
+
+    def test_number_outside_precision(self):
+        rp = RawProduct(store_sku="A", name="Milk", price=Decimal("1000000"))
+        assert base._unsaveable_reason(rp) == "price out of range"
+        rp = RawProduct(store_sku="A", name="Milk", price=Decimal("NaN"))
+        assert base._unsaveable_reason(rp) == "price out of range"
+
+
+# =========================================================================
+# BaseScraper.scrape_all
+# =========================================================================
+
+
+class _FakeScraper(BaseScraper):
+    store_slug = "fake"
+    max_concurrency = 2
+
+    def __init__(self) -> None:
+        self.active = 0
+        self.peak = 0
+
+    async def get_category_urls(self) -> list[str]:
+        return []
+
+    async def scrape_category(self, category_url: str) -> list[RawProduct]:
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(0.01)
+        self.active -= 1
+        if category_url == "bad":
+            raise ValueError("boom")
+        return [RawProduct(store_sku=category_url, name=category_url, price=Decimal("1"))]
+
+
+class TestScrapeAll:
+    """Tests for ``BaseScraper.scrape_all``."""
+
+    @pytest.fixture(autouse=True)
+    def _no_delay(self, monkeypatch):
+        async def _noop(*args, **kwargs):
+            return None
+
+        monkeypatch.setattr(base, "random_delay", _noop)
+
+    async def test_results_in_url_order(self):
+        outcomes = await _FakeScraper().scrape_all(["a", "b", "c"])
+        assert [o[0].store_sku for o in outcomes] == ["a", "b", "c"]
+
+    async def test_failed_category_returns_exception(self):
+        outcomes = await _FakeScraper().scrape_all(["a", "bad", "c"])
+        assert isinstance(outcomes[1], ValueError)
+        assert outcomes[2][0].store_sku == "c"
+
+    async def test_sink_receives_products_and_counts_returned(self):
+        received = []
+        outcomes = await _FakeScraper().scrape_all(["a", "bad", "c"], sink=received.append)
+        assert outcomes[0] == 1 and outcomes[2] == 1
+        assert isinstance(outcomes[1], ValueError)
+        assert sorted(batch[0].store_sku for batch in received) == ["a", "c"]
+
+    async def test_delay_between_categories_can_be_disabled(self, monkeypatch):
+        calls = []
+
+        async def _record(*args, **kwargs):
+            calls.append(args)
+
+        monkeypatch.setattr(base, "random_delay", _record)
+        scraper = _FakeScraper()
+        await scraper.scrape_all(["a", "b"])
+        assert len(calls) == 2
+
+        calls.clear()
+        scraper.delay_enabled = False
+        await scraper.scrape_all(["a", "b"])
+        assert calls == []
+
+    async def test_respects_max_concurrency(self):
+        scraper = _FakeScraper()
+        await scraper.scrape_all([str(i) for i in range(6)])
+        assert scraper.peak == 2
+
+
+# =========================================================================
+# BaseScraper.run
+# =========================================================================
+
+
+class _RunSession:
+    """Minimal stand-in for the sessions ``run()`` opens."""
+
+    runs: dict = {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+    def add(self, obj) -> None:
+        obj.id = 1
+        self.runs[1] = obj
+
+    async def commit(self) -> None:
+        pass
+
+    async def get(self, model, key):
+        return self.runs.get(key)
+
+
+def _async_value(value):
+    async def _method(self, *args, **kwargs):
+        return value
+
+    return _method
+
+
+class TestRun:
+    """Tests for ``BaseScraper.run`` bookkeeping."""
+
+    @pytest.fixture(autouse=True)
+    def _fake_db(self, monkeypatch):
+        _RunSession.runs = {}
+
+        async def _store(self, session):
+            return type("Store", (), {"id": 1})()
+
+        monkeypatch.setattr(base, "async_session", _RunSession)
+        monkeypatch.setattr(BaseScraper, "_get_store", _store)
+
+    async def test_cancelled_category_is_recorded(self, monkeypatch):
+        async def _scrape_all(self, urls, sink=None):
+            return [asyncio.CancelledError(), 2]
+
+        monkeypatch.setattr(_FakeScraper, "get_category_urls", _async_value(["a", "b"]))
+        monkeypatch.setattr(_FakeScraper, "scrape_all", _scrape_all)
+        result = await _FakeScraper().run()
+
+        assert result.products_scraped == 2
+        assert len(result.errors) == 1 and result.errors[0].startswith("Error scraping a")
+        assert _RunSession.runs[1].status == "partial"
+
+    async def test_saver_failure_still_finalizes_run(self, monkeypatch):
+        async def _broken_saver(self, chunks, result):
+            raise RuntimeError("saver died")
+
+        monkeypatch.setattr(_FakeScraper, "get_category_urls", _async_value([]))
+        monkeypatch.setattr(_FakeScraper, "_save_chunks", _broken_saver)
+        result = await _FakeScraper().run()
+
+        assert result.errors == ["Error saving results: saver died"]
+        scrape_run = _RunSession.runs[1]
+        assert scrape_run.status == "failed"
+        assert scrape_run.finished_at is not None
+
+
+# =========================================================================
+# BaseScraper._pooled_page
+# =========================================================================
+
+
+class _FakePage:
+    def __init__(self) -> None:
+        self.closed = False
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+class _FakeContext:
+    async def new_page(self) -> _FakePage:
+        return _FakePage()
+
+
+class _PooledScraper(_FakeScraper):
+    def __init__(self) -> None:
+        super().__init__()
+        self.opened = 0
+
+    async def _open_context(self) -> _FakeContext:
+        self.opened += 1
+        return _FakeContext()
+
+
+class TestPooledPage:
+    """Tests for ``BaseScraper._pooled_page``."""
+
+    async def test_context_reused_across_pages(self):
+        scraper = _PooledScraper()
+        async with scraper._pooled_page() as first:
+            pass
+        async with scraper._pooled_page() as second:
+            pass
+        assert scraper.opened == 1
+        assert first is not second
+        assert first.closed and second.closed
+
+    async def test_concurrent_pages_get_own_context(self):
+        scraper = _PooledScraper()
+        async with scraper._pooled_page(), scraper._pooled_page():
+            pass
+        assert scraper.opened == 2
+        async with scraper._pooled_page():
+            pass
+        assert scraper.opened == 2
+
+
+# =========================================================================
+# BaseScraper._configure_context
+# =========================================================================
+
+
+class _RecordingBrowser:
+    def __init__(self) -> None:
+        self.context_kwargs: dict = {}
+
+    async def new_context(self, **kwargs) -> _FakeContext:
+        self.context_kwargs = kwargs
+        return _FakeContext()
+
+
+class TestConfigureContext:
+    """Tests for ``BaseScraper._configure_context``."""
+
+    async def test_service_workers_allowed_by_default(self):
+        browser = _RecordingBrowser()
+        await BaseScraper._configure_context(browser, block_resources=False)
+        assert "service_workers" not in browser.context_kwargs
+
+    async def test_service_workers_blocked_on_request(self):
+        browser = _RecordingBrowser()
+        await BaseScraper._configure_context(
+            browser, block_resources=False, block_service_workers=True
+        )
+        assert browser.context_kwargs["service_workers"] == "block"
+
+
+# =========================================================================
+# BaseScraper.save_results
+# =========================================================================
+
+
+class _SyncSessionAdapter:
+    """Expose a synchronous SQLite ``Session`` through the async calls
+    ``save_results`` makes, so the batched SQL runs against a real database."""
+
+    def __init__(self, session: Session) -> None:
+        self.sync = session
+        self.fail_commit = False
+
+    async def execute(self, *args, **kwargs):
+        return self.sync.execute(*args, **kwargs)
+
+    def add(self, obj) -> None:
+        self.sync.add(obj)
+
+    async def flush(self) -> None:
+        self.sync.flush()
+
+    async def commit(self) -> None:
+        if self.fail_commit:
+            raise RuntimeError("commit failed")
+        self.sync.commit()
+
+    async def rollback(self) -> None:
+        self.sync.rollback()
+
+    async def connection(self):
+        return self.sync.connection()
+
+
+def _raw(sku: str, **kwargs) -> RawProduct:
+    kwargs.setdefault("name", f"Product {sku}")
+    kwargs.setdefault("price", Decimal("1.50"))
+    return RawProduct(store_sku=sku, **kwargs)
+
+
+@pytest.mark.filterwarnings("ignore::sqlalchemy.exc.SAWarning")
+class TestSaveResults:
+    """Tests for ``BaseScraper.save_results`` against an in-memory SQLite database."""
+
+    @pytest.fixture(autouse=True)
+    def db(self, monkeypatch):
+        # SQLite speaks the same ON CONFLICT ... RETURNING upsert
+        monkeypatch.setattr(base, "pg_insert", sqlite_insert)
+        engine = create_engine("sqlite://")
+        Base.metadata.create_all(engine)
+        with Session(engine) as session:
+            session.add(Store(name="Fake", slug="fake", base_url="https://fake.ie"))
+            session.add(Category(name="Bakery", slug="bakery"))
+            session.add(Product(name="Milk 2L", ean="5011038123456"))
+            session.commit()
+        self.engine = engine
+        yield
+        engine.dispose()
+
+    async def _save(self, scraper: BaseScraper, products: list[RawProduct], **adapter_attrs):
+        with Session(self.engine) as session:
+            adapter = _SyncSessionAdapter(session)
+            for name, value in adapter_attrs.items():
+                setattr(adapter, name, value)
+            try:
+                await scraper.save_results(products, adapter)
+            except Exception:
+                session.rollback()
+                raise
+
+    def _rows(self, model) -> list:
+        with Session(self.engine) as session:
+            return list(session.scalars(select(model).order_by(model.id)))
+
+    async def test_creates_listings_products_and_prices(self):
+        scraper = _FakeScraper()
+        await self._save(
+            scraper,
+            [
+                _raw("1", category="Bakery", product_url="/p/1"),
+                _raw("2", ean="5011038123456"),
+                _raw("1", name="Product 1 renamed", price=Decimal("1.40")),
+            ],
+        )
+
+        listings = {sp.store_sku: sp for sp in self._rows(StoreProduct)}
+        assert listings["1"].store_name == "Product 1 renamed"
+        assert listings["1"].store_url == "/p/1"
+        products = {p.id: p for p in self._rows(Product)}
+        # SKU 2 is matched to the existing product by EAN
+        assert products[listings["2"].product_id].name == "Milk 2L"
+        categories = {c.slug: c.id for c in self._rows(Category)}
+        assert products[listings["1"].product_id].category_id == categories["bakery"]
+        prices = self._rows(PriceRecord)
+        assert [(p.store_product_id, p.price) for p in prices] == [
+            (listings["1"].id, Decimal("1.50")),
+            (listings["2"].id, Decimal("1.50")),
+            (listings["1"].id, Decimal("1.40")),
+        ]
+
+    async def test_existing_listing_is_updated_not_duplicated(self):
+        scraper = _FakeScraper()
+        await self._save(scraper, [_raw("1", product_url="/p/1")])
+        await self._save(scraper, [_raw("1", name="New name", price=Decimal("2.00"))])
+
+        (listing,) = self._rows(StoreProduct)
+        assert listing.store_name == "New name"
+        # A missing URL keeps the stored one
+        assert listing.store_url == "/p/1"
+        assert len(self._rows(Product)) == 2
+        assert [p.price for p in self._rows(PriceRecord)] == [Decimal("1.50"), Decimal("2.00")]
+
+    async def test_unsaveable_products_are_skipped(self):
+        await self._save(_FakeScraper(), [_raw("1"), _raw("2", ean="1" * 14)])
+        assert [sp.store_sku for sp in self._rows(StoreProduct)] == ["1"]
+
+    async def test_category_ids_cached_across_saves(self):
+        scraper = _FakeScraper()
+        await self._save(scraper, [_raw("1", category="Frozen")])
+        assert scraper._category_ids == {"frozen": self._rows(Category)[-1].id}
+
+        await self._save(scraper, [_raw("2", category="Frozen")])
+        assert len(self._rows(Category)) == 2
+        products = {p.id: p for p in self._rows(Product)}
+        assert {products[sp.product_id].category_id for sp in self._rows(StoreProduct)} == {
+            scraper._category_ids["frozen"]
+        }
+
+    async def test_failed_save_does_not_cache_rolled_back_category(self):
+        scraper = _FakeScraper()
+        with pytest.raises(RuntimeError):
+            await self._save(scraper, [_raw("1", category="Frozen")], fail_commit=True)
+        assert "frozen" not in (scraper._category_ids or {})
+
+        await self._save(scraper, [_raw("1", category="Frozen")])
+        (listing,) = self._rows(StoreProduct)
+        category_ids = {c.id for c in self._rows(Category)}
+        product = next(p for p in self._rows(Product) if p.id == listing.product_id)
+        assert product.category_id in category_ids
+
+    async def test_large_batch_falls_back_to_chunked_inserts(self, monkeypatch):
+        # SQLite is not asyncpg, so COPY is skipped for the plain INSERTs
+        monkeypatch.setattr(base, "BULK_CHUNK", 7)
+        products = [_raw(str(i)) for i in range(base.COPY_THRESHOLD + 5)]
+        await self._save(_FakeScraper(), products)
+        assert len(self._rows(PriceRecord)) == len(products)
+
+
+class _FakeRawConnection:
+    def __init__(self) -> None:
+        self.copied = []
+
+    async def copy_records_to_table(self, table, records, columns):
+        self.copied.append((table, records, columns))
+
+
+class _FakeConnection:
+    def __init__(self, driver: str) -> None:
+        self.dialect = type("Dialect", (), {"driver": driver})()
+        self.raw = _FakeRawConnection()
+
+    async def get_raw_connection(self):
+        return type("Raw", (), {"driver_connection": self.raw})()
+
+
+class _ConnectionSession:
+    def __init__(self, connection: _FakeConnection) -> None:
+        self._connection = connection
+
+    async def connection(self) -> _FakeConnection:
+        return self._connection
+
+
+class TestCopyPriceRecords:
+    """Tests for ``BaseScraper._copy_price_records``."""
+
+    ROW = {
+        "store_product_id": 1,
+        "price": Decimal("1.50"),
+        "promo_price": None,
+        "promo_label": None,
+        "unit_price": None,
+        "in_stock": True,
+    }
+
+    async def test_copies_with_asyncpg(self):
+        connection = _FakeConnection("asyncpg")
+        copied = await BaseScraper._copy_price_records(_ConnectionSession(connection), [self.ROW])
+        assert copied is True
+        assert connection.raw.copied == [
+            (
+                "price_records",
+                [(1, Decimal("1.50"), None, None, None, True)],
+                base.PRICE_RECORD_COLUMNS,
+            )
+        ]
+
+    async def test_other_drivers_write_nothing(self):
+        connection = _FakeConnection("psycopg")
+        copied = await BaseScraper._copy_price_records(_ConnectionSession(connection), [self.ROW])
+        assert copied is False
+        assert connection.raw.copied == []
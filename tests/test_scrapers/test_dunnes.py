@@ -0,0 +1,200 @@
+"""Tests for the Dunnes Stores scraper's browser-free paths."""
+
+from __future__ import annotations
+
+from decimal import Decimal
+
+import httpx
+import pytest
+from lxml import html as lxml_html
+
+from src.scrapers.dunnes import (
+    _NAME_SELECTOR,
+    _PRICE_SELECTOR,
+    _PROMO_SELECTOR,
+    _TILE_SELECTOR,
+    BASE_URL,
+    DunnesScraper,
+    _css_xpath,
+)
+
+CATEGORY_URL = f"{BASE_URL}/categories/bakery-id-47171"
+
+
+def _tile(sku: str, name: str, price: str) -> str:
+    return (
+        f'<div data-product-id="{sku}">'
+        f'<a data-ref="productCardTitle" href="/p/{sku}">{name}</a>'
+        f'<span class="price">€{price}</span>'
+        "</div>"
+    )
+
+
+def _page(*tiles: str, footer: str = "") -> str:
+    return f"<html><body><main>{''.join(tiles)}</main>{footer}</body></html>"
+
+
+def _scraper(pages: dict[str, str]) -> DunnesScraper:
+    """A scraper whose httpx client serves *pages* keyed by URL."""
+
+    def _handler(request: httpx.Request) -> httpx.Response:
+        body = pages.get(str(request.url))
+        if body is None:
+            return httpx.Response(404)
+        return httpx.Response(200, text=body, headers={"content-type": "text/html"})
+
+    scraper = DunnesScraper()
+    scraper._client = httpx.AsyncClient(transport=httpx.MockTransport(_handler))
+    return scraper
+
+
+# =========================================================================
+# DunnesScraper._scrape_with_httpx
+# =========================================================================
+
+
+class TestScrapeWithHttpx:
+    """Tests for the httpx fast path of ``DunnesScraper.scrape_category``."""
+
+    @pytest.fixture(autouse=True)
+    def _no_browser(self, monkeypatch):
+        self.browser_calls = []
+
+        async def _fake_playwright(scraper, url):
+            self.browser_calls.append(url)
+            return []
+
+        monkeypatch.setattr(DunnesScraper, "_scrape_with_playwright", _fake_playwright)
+
+    async def test_follows_next_page_links(self):
+        scraper = _scraper(
+            {
+                CATEGORY_URL: _page(
+                    _tile("1", "Brown Bread 800g", "2.10"),
+                    _tile("2", "White Bread 800g", "1.90"),
+                    footer='<a rel="next" href="?page=2">Next</a>',
+                ),
+                f"{CATEGORY_URL}?page=2": _page(_tile("3", "Bagels 5pk", "2.50")),
+            }
+        )
+        products = await scraper.scrape_category(CATEGORY_URL)
+        await scraper.aclose()
+
+        assert [p.store_sku for p in products] == ["1", "2", "3"]
+        assert products[2].price == Decimal("2.50")
+        assert products[2].product_url == f"{BASE_URL}/p/3"
+        assert self.browser_calls == []
+
+    async def test_repeated_page_stops_pagination(self):
+        page = _page(
+            _tile("1", "Brown Bread 800g", "2.10"),
+            footer=f'<a rel="next" href="{CATEGORY_URL}">Next</a>',
+        )
+        scraper = _scraper({CATEGORY_URL: page})
+        products = await scraper.scrape_category(CATEGORY_URL)
+        await scraper.aclose()
+
+        assert [p.store_sku for p in products] == ["1"]
+
+    async def test_load_more_button_falls_back_to_browser(self):
+        scraper = _scraper(
+            {
+                CATEGORY_URL: _page(
+                    _tile("1", "Brown Bread 800g", "2.10"),
+                    footer="<button>Load More</button>",
+                ),
+            }
+        )
+        products = await scraper.scrape_category(CATEGORY_URL)
+        await scraper.aclose()
+
+        assert products == []
+        assert self.browser_calls == [CATEGORY_URL]
+
+
+# =========================================================================
+# DunnesScraper._extract_from_js_state
+# =========================================================================
+
+
+class _StatePage:
+    def __init__(self, candidates: list[list[str]]) -> None:
+        self.candidates = candidates
+
+    async def evaluate(self, script: str) -> list[list[str]]:
+        return self.candidates
+
+
+class TestExtractFromJsState:
+    """Tests for ``DunnesScraper._extract_from_js_state``."""
+
+    async def test_falls_through_to_later_sources(self):
+        page = _StatePage(
+            [
+                ["next", '{"props": {"pageProps": {"menu": [{"title": "Bakery"}]}}}'],
+                ["dl", "not json"],
+                ["dl", '[{"name": "Bagels 5pk", "id": "3", "price": "2.50"}]'],
+            ]
+        )
+        products = await DunnesScraper()._extract_from_js_state(page, CATEGORY_URL)
+        assert [(p.store_sku, p.price) for p in products] == [("3", Decimal("2.50"))]
+
+    async def test_no_candidates(self):
+        products = await DunnesScraper()._extract_from_js_state(_StatePage([]), CATEGORY_URL)
+        assert products == []
+
+
+# =========================================================================
+# _css_xpath
+# =========================================================================
+
+
+class TestCssXpath:
+    """Tests for the CSS-subset to XPath compiler behind the httpx tile pass."""
+
+    DOC = lxml_html.fromstring(
+        "<div>"
+        '<div id="a" class="ProductCard big" data-product-id="1">'
+        '<h3 id="h">Title</h3><span id="p" class="price-value">1</span>'
+        "</div>"
+        '<li id="b" class="x productTile"><del id="d">2</del><s id="s">3</s></li>'
+        '<a id="c" class="product-card" data-ref="productCardTitle" href="/p/1">x</a>'
+        "</div>"
+    )
+
+    def _ids(self, selector: str) -> list[str]:
+        return [el.get("id") for el in _css_xpath(selector)(self.DOC)]
+
+    def test_tag(self):
+        assert self._ids("h3") == ["h"]
+
+    def test_class(self):
+        assert self._ids("div.ProductCard") == ["a"]
+        # Whole class tokens only, like CSS
+        assert self._ids(".Product") == []
+
+    def test_attribute_presence(self):
+        assert self._ids("div[data-product-id]") == ["a"]
+
+    def test_attribute_equals(self):
+        assert self._ids("a[data-ref='productCardTitle']") == ["c"]
+        assert self._ids("a[data-ref='productCard']") == []
+
+    def test_attribute_contains(self):
+        assert self._ids("[class*='product']") == ["b", "c"]
+        assert self._ids("span[class*='price']") == ["p"]
+
+    def test_descendant(self):
+        assert self._ids("div[data-product-id] span") == ["p"]
+        assert self._ids("li span") == []
+
+    def test_selector_list_in_document_order(self):
+        assert self._ids("s, del, h3") == ["h", "d", "s"]
+
+    def test_module_selectors_compile(self):
+        for selector in (_TILE_SELECTOR, _NAME_SELECTOR, _PRICE_SELECTOR, _PROMO_SELECTOR):
+            _css_xpath(selector)
+
+    def test_unsupported_selector(self):
+        with pytest.raises(ValueError):
+            _css_xpath("div > span")